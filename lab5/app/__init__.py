@@ -1,16 +1,59 @@
 import sys
+import asyncio
+from typing import Any
+from collections.abc import Callable, Coroutine
 
+from qasync import QEventLoop
 from PyQt5.QtWidgets import QApplication
 
 from .main_window import MainWindow
 
 
-def run() -> None:
-    """Run the application."""
+def run(
+    on_startup: Callable[[], Coroutine[Any, Any, None]] | None = None,
+    on_shutdown: Callable[[], Coroutine[Any, Any, None]] | None = None,
+) -> None:
+    """
+    Run the application.
+
+    A single asyncio event loop integrated with the Qt event loop is used for the whole
+    lifetime of the application, so coroutines started from the UI are scheduled as tasks
+    on it and database connections and the shared HTTP session are reused across calls.
+    The HTTP session is closed when the application quits.
+
+    The window is shown disabled before on_startup runs and is enabled once it completes,
+    then the first posts are loaded in the background.
+
+    Args:
+        on_startup (Callable[[], Coroutine[Any, Any, None]] | None, optional): Coroutine
+            function to run on the application loop after the window is shown.
+        on_shutdown (Callable[[], Coroutine[Any, Any, None]] | None, optional): Coroutine
+            function to run on the application loop after the window is closed.
+    """
     app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec_())
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+
+    with loop:
+        window = MainWindow()
+        window.setEnabled(False)
+        window.show()
+        if on_startup is not None:
+            loop.run_until_complete(on_startup())
+        window.setEnabled(True)
+        window.create_task(window.load_posts())
+
+        app_close_event = asyncio.Event()
+        app.aboutToQuit.connect(app_close_event.set)
+
+        loop.run_until_complete(app_close_event.wait())
+        # The HTTP stack is only imported once posts are fetched, so there is only a
+        # session to close if it was.
+        http_client = sys.modules.get("http_client")
+        if http_client is not None:
+            loop.run_until_complete(http_client.close_session())
+        if on_shutdown is not None:
+            loop.run_until_complete(on_shutdown())
 
 
 __all__ = ["run"]
@@ -1,19 +1,22 @@
-import asyncio
 from typing import Any
 from collections.abc import Callable, Coroutine
 
 import PyQt5.QtWidgets as widgets
 
-from store import PostRepository
-from schemas import PostAddSchema
+from schemas import PostSchema, PostAddSchema
 
 
 class AddDialog(widgets.QWidget):
     """Dialog widget for adding a post."""
 
-    def __init__(self, update_function: Callable[[], Coroutine[Any, Any, None]]) -> None:
+    def __init__(
+        self,
+        added_function: Callable[[PostSchema], None],
+        create_task: Callable[[Coroutine[Any, Any, None]], Any],
+    ) -> None:
         super().__init__()
-        self.update_function = update_function
+        self.added_function = added_function
+        self.create_task = create_task
 
         self.setWindowTitle("Add post")
         self.setGeometry(400, 400, 300, 200)
@@ -33,23 +36,27 @@ class AddDialog(widgets.QWidget):
 
         self.setLayout(layout)
 
-    async def add_post(self) -> None:
-        """Add a post to the database."""
-        post = PostAddSchema(
-            user_id=int(self.user_id_input.text()),
-            title=self.title_input.text(),
-            body=self.body_input.text(),
-        )
-        await PostRepository.add_one(post)
-        await self.update_function()
+    async def add_post(self, post: PostAddSchema) -> None:
+        """
+        Add a post to the database and pass the added post to the added function.
+
+        Args:
+            post (PostAddSchema): The post to add.
+        """
+        from store import PostRepository
+
+        added_post = await PostRepository.add_one(post)
+        self.added_function(added_post)
 
     def add_post_callback(self) -> None:
         """Callback function for the add button."""
         try:
-            loop = asyncio.get_running_loop()
-            loop.run_until_complete(self.add_post())
-        except RuntimeError:
-            asyncio.run(self.add_post())
+            post = PostAddSchema(
+                user_id=int(self.user_id_input.text()),
+                title=self.title_input.text(),
+                body=self.body_input.text(),
+            )
+            self.create_task(self.add_post(post))
         finally:
             self.user_id_input.clear()
             self.title_input.clear()
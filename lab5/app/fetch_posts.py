@@ -1,16 +1,42 @@
-import queue
 import asyncio
-import threading
+from typing import TYPE_CHECKING
 from collections.abc import Callable, AsyncGenerator
 
 from PyQt5.QtWidgets import QProgressBar
 
 from core import settings
-from store import PostRepository
 from schemas import PostAddSchema
-from http_client import JPHTTPClient
 
-posts_queue = queue.Queue()
+if TYPE_CHECKING:
+    from http_client import ResponseCache
+
+# Posts downloaded ahead of the consumer. When the queue is full, the producer stops
+# reading the response until the consumer catches up.
+POSTS_QUEUE_SIZE = 100
+
+_response_cache: "ResponseCache | None" = None
+
+
+def get_response_cache() -> "ResponseCache":
+    """
+    Get the cache of JSONPlaceholder responses, creating it on first use.
+
+    The HTTP stack is imported here rather than at module level, so it is only loaded
+    once posts are fetched for the first time and does not slow down startup.
+
+    Returns:
+        ResponseCache: The cache shared by all fetches.
+    """
+    global _response_cache
+    if _response_cache is None:
+        from http_client import ResponseCache
+
+        _response_cache = ResponseCache(
+            ttl=settings.HTTP_CACHE_TTL,
+            max_entries=settings.HTTP_CACHE_MAX_ENTRIES,
+            path=settings.HTTP_CACHE_PATH,
+        )
+    return _response_cache
 
 
 class FetchProgressBar(QProgressBar):
@@ -23,26 +49,26 @@ class FetchProgressBar(QProgressBar):
 
         self.finished_func = finished_func
 
-    async def posts_generator(
-        self,
-        time_sleep: float = 0,
-    ) -> AsyncGenerator[PostAddSchema, None]:
+    async def posts_generator(self) -> AsyncGenerator[PostAddSchema, None]:
         """
-        Generate posts from the JSONPlaceholder API.
+        Generate posts from the JSONPlaceholder API as they are downloaded.
 
-        Args:
-            time_sleep (float, optional): The amount of time to sleep after adding the post. Defaults to 0.
+        The number of posts is not known in advance, so the maximum of the progress bar
+        grows with every post received and its value with every post added.
 
         Yields:
             PostAddSchema: The post to add to the database.
         """
-        async with JPHTTPClient(settings.BASE_URL) as jp_client:
-            posts = await jp_client.fetch_posts()
-        self.setRange(0, len(posts))
+        from http_client import JPHTTPClient
+
+        self.setRange(0, 0)
         self.setValue(0)
-        for post in posts:
-            yield post
-            await asyncio.sleep(time_sleep)
+        async with JPHTTPClient(
+            settings.BASE_URL, cache=get_response_cache()
+        ) as jp_client:
+            async for post in jp_client.stream_posts():
+                self.setMaximum(self.maximum() + 1)
+                yield post
 
     async def posts_handler(self, post: PostAddSchema, time_sleep: float = 0) -> None:
         """
@@ -52,47 +78,53 @@ class FetchProgressBar(QProgressBar):
             post (PostAddSchema): The post to add to the database.
             time_sleep (float, optional): The amount of time to sleep after adding the post. Defaults to 0.
         """
+        from store import PostRepository
+
         await PostRepository.lazy_add(post)
         self.setValue(self.value() + 1)
         await asyncio.sleep(time_sleep)
 
-    async def posts_producer(self) -> None:
-        """Produce posts and add them to the queue."""
-        async for post in self.posts_generator(0.05):
-            posts_queue.put(post)
-
-    async def posts_consumer(self) -> None:
-        """Consume posts from the queue and add them to the database."""
-        while True:
-            try:
-                post: PostAddSchema = posts_queue.get(timeout=0.5)
-                await self.posts_handler(post, 0.05)
-                posts_queue.task_done()
-            except queue.Empty:
-                break
-
-    def get_posts_producer_thread(self) -> threading.Thread:
-        """Get the posts producer thread."""
-
-        def producer_sync() -> None:
-            try:
-                loop = asyncio.get_running_loop()
-                loop.run_until_complete(self.posts_producer())
-            except RuntimeError:
-                asyncio.run(self.posts_producer())
-
-        return threading.Thread(target=producer_sync, name="posts_producer", daemon=True)
-
-    def get_posts_consumer_thread(self) -> threading.Thread:
-        """Get the posts consumer thread."""
-
-        def consumer_sync() -> None:
-            try:
-                loop = asyncio.get_running_loop()
-                loop.run_until_complete(self.posts_consumer())
-            except RuntimeError:
-                asyncio.run(self.posts_consumer())
-            finally:
-                self.finished_func()
-
-        return threading.Thread(target=consumer_sync, name="posts_consumer", daemon=True)
+    async def posts_producer(
+        self, posts_queue: asyncio.Queue[PostAddSchema | None]
+    ) -> None:
+        """
+        Produce posts and add them to the queue.
+
+        Args:
+            posts_queue (asyncio.Queue[PostAddSchema | None]): The queue to put posts into.
+                None is put after the last post.
+        """
+        # No None is put if the producer fails: the task group cancels the consumer then,
+        # and putting into a full queue after cancellation would never return.
+        async for post in self.posts_generator():
+            await posts_queue.put(post)
+        await posts_queue.put(None)
+
+    async def posts_consumer(
+        self, posts_queue: asyncio.Queue[PostAddSchema | None]
+    ) -> None:
+        """
+        Consume posts from the queue and add them to the database.
+
+        Args:
+            posts_queue (asyncio.Queue[PostAddSchema | None]): The queue to get posts from.
+        """
+        while (post := await posts_queue.get()) is not None:
+            await self.posts_handler(post, 0.05)
+            posts_queue.task_done()
+
+    async def fetch_posts(self) -> None:
+        """
+        Run the posts producer and consumer concurrently on the current event loop.
+
+        If either of them fails, the other one is cancelled.
+        """
+        posts_queue: asyncio.Queue[PostAddSchema | None] = asyncio.Queue(
+            maxsize=POSTS_QUEUE_SIZE
+        )
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self.posts_producer(posts_queue))
+                group.create_task(self.posts_consumer(posts_queue))
+        finally:
+            self.finished_func()
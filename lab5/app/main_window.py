@@ -1,23 +1,37 @@
 import asyncio
+from typing import Any
+from collections.abc import Coroutine
 
 import PyQt5.QtWidgets as widgets
+from loguru import logger
+from PyQt5.QtCore import pyqtSignal
 
-from store import PostRepository
+from schemas import PostSchema
 
 from .add_dialog import AddDialog
 from .fetch_posts import FetchProgressBar
+from .posts_model import PostTableModel
+
+SEARCH_DEBOUNCE = 0.15
 
 
 class MainWindow(widgets.QMainWindow):
+    # Emitted whenever load_posts has displayed the posts of the database.
+    posts_loaded = pyqtSignal()
+
     def __init__(self) -> None:
         super().__init__()
 
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._search_task: asyncio.Task[None] | None = None
+        self._fetch_task: asyncio.Task[None] | None = None
+
         self.setWindowTitle("Posts")
         self.setGeometry(300, 300, 800, 600)
 
-        self.table = widgets.QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "User ID", "Title", "Body"])
+        self.posts_model = PostTableModel()
+        self.table = widgets.QTableView()
+        self.table.setModel(self.posts_model)
 
         self.search_input = widgets.QLineEdit(self)
         self.search_input.setPlaceholderText("Search by title")
@@ -49,45 +63,81 @@ class MainWindow(widgets.QMainWindow):
         self.setCentralWidget(main_widget)
         main_widget.setLayout(layout)
 
-        asyncio.run(self.load_posts())
+        self.add_dialog = AddDialog(self.post_added, self.create_task)
+
+    def create_task(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        """
+        Schedule a coroutine as a task on the application event loop.
+
+        Args:
+            coro (Coroutine[Any, Any, None]): The coroutine to schedule.
 
-        self.add_dialog = AddDialog(self.load_posts)
+        Returns:
+            asyncio.Task[None]: The scheduled task.
+        """
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a finished task and log its exception, if any."""
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if exception is not None:
+            logger.opt(exception=exception).error(
+                "Task {name} failed.", name=task.get_name()
+            )
 
     async def load_posts(self) -> None:
         """Load all posts from the database and display them in the table."""
-        posts = await PostRepository.find_all()
-        self.table.setRowCount(len(posts))
+        # The database stack is imported on first use rather than with this module, so
+        # SQLAlchemy is not loaded until after the window is shown.
+        from store import PostRepository
 
-        for row, post in enumerate(posts):
-            self.table.setItem(row, 0, widgets.QTableWidgetItem(str(post.id)))
-            self.table.setItem(row, 1, widgets.QTableWidgetItem(str(post.user_id)))
-            self.table.setItem(row, 2, widgets.QTableWidgetItem(post.title))
-            self.table.setItem(row, 3, widgets.QTableWidgetItem(post.body))
+        posts = await asyncio.shield(PostRepository.find_all(validate=False))
+        self.posts_model.set_posts(posts)
+        self.posts_loaded.emit()
 
     async def filter_post(self) -> None:
-        """Filter posts by title and display them in the table."""
+        """
+        Filter posts by title and display them in the table.
+
+        The search waits for SEARCH_DEBOUNCE seconds first, so a task superseded by the next
+        keystroke is usually cancelled before it queries the database. Queries themselves
+        are shielded, so cancellation never interrupts an open database session.
+        """
+        from store import PostRepository
+
         filter_title = self.search_input.text()
+        await asyncio.sleep(SEARCH_DEBOUNCE)
         if filter_title == "":
             await self.load_posts()
             return
 
-        posts = await PostRepository.find_by_title(filter_title)
-        self.table.setRowCount(len(posts))
+        posts = await asyncio.shield(
+            PostRepository.find_by_title(filter_title, validate=False)
+        )
+        self.posts_model.set_posts(posts)
+
+    def post_added(self, post: PostSchema) -> None:
+        """
+        Append an added post to the table unless it is hidden by the title filter.
 
-        for row, post in enumerate(posts):
-            self.table.setItem(row, 0, widgets.QTableWidgetItem(str(post.id)))
-            self.table.setItem(row, 1, widgets.QTableWidgetItem(str(post.user_id)))
-            self.table.setItem(row, 2, widgets.QTableWidgetItem(post.title))
-            self.table.setItem(row, 3, widgets.QTableWidgetItem(post.body))
+        Args:
+            post (PostSchema): The added post.
+        """
+        filter_title = self.search_input.text()
+        if filter_title.lower() not in post.title.lower():
+            return
+        self.posts_model.add_post(post)
 
     def fetch_finished(self) -> None:
         """Update the progress bar when the posts producer thread finishes."""
         self.progress_bar.setValue(0)
-        try:
-            loop = asyncio.get_running_loop()
-            loop.run_until_complete(self.load_posts())
-        except RuntimeError:
-            asyncio.run(self.load_posts())
+        self.create_task(self.load_posts())
 
     async def delete_post(self, post_id: int) -> None:
         """
@@ -96,16 +146,16 @@ class MainWindow(widgets.QMainWindow):
         Args:
             post_id (int): The ID of the post to delete.
         """
-        await PostRepository.delete_one(post_id)
-        await self.load_posts()
+        from store import PostRepository
+
+        if await PostRepository.delete_one(post_id):
+            self.posts_model.remove_post(post_id)
 
     def filter_posts_callback(self) -> None:
         """Filter posts by title and display them in the table."""
-        try:
-            loop = asyncio.get_running_loop()
-            loop.run_until_complete(self.filter_post())
-        except RuntimeError:
-            asyncio.run(self.filter_post())
+        if self._search_task is not None:
+            self._search_task.cancel()
+        self._search_task = self.create_task(self.filter_post())
 
     def add_post_callback(self) -> None:
         """Open the add post dialog and reload the posts when the dialog is closed."""
@@ -113,16 +163,12 @@ class MainWindow(widgets.QMainWindow):
 
     def delete_post_callback(self) -> None:
         """Delete the selected post from the database."""
-        post_id = self.table.item(self.table.currentRow(), 0)
-        if post_id == None:
+        index = self.table.currentIndex()
+        if not index.isValid():
             widgets.QMessageBox.warning(self, "Error", "No post selected")
             return
 
-        try:
-            post_id = int(post_id.text())
-        except ValueError:
-            widgets.QMessageBox.warning(self, "Error", "Invalid post ID")
-            return
+        post_id = self.posts_model.post_id(index.row())
 
         reply = widgets.QMessageBox.question(
             self,
@@ -135,13 +181,10 @@ class MainWindow(widgets.QMainWindow):
         if reply != widgets.QMessageBox.Yes:
             return
 
-        try:
-            loop = asyncio.get_running_loop()
-            loop.run_until_complete(self.delete_post(post_id))
-        except RuntimeError:
-            asyncio.run(self.delete_post(post_id))
+        self.create_task(self.delete_post(post_id))
 
     def fetch_posts_callback(self) -> None:
-        """Start the posts producer and consumer threads."""
-        self.progress_bar.get_posts_producer_thread().start()
-        self.progress_bar.get_posts_consumer_thread().start()
+        """Start fetching posts unless a fetch is already in progress."""
+        if self._fetch_task is not None and not self._fetch_task.done():
+            return
+        self._fetch_task = self.create_task(self.progress_bar.fetch_posts())
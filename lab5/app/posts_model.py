@@ -0,0 +1,230 @@
+from array import array
+from typing import Any
+from collections.abc import Iterable, Sequence
+
+from PyQt5.QtCore import Qt, QModelIndex, QAbstractTableModel
+
+from schemas import PostSchema
+
+HEADERS = ("ID", "User ID", "Title", "Body")
+
+
+class PostTableModel(QAbstractTableModel):
+    """
+    Table model of posts backed by a columnar cache.
+
+    Every column is stored separately (ids and user ids in compact integer arrays), cells
+    are rendered lazily in data() and refreshes are applied to the view as minimal
+    row insertions, removals and changes instead of rebuilding the whole table.
+
+    Methods:
+        set_posts(posts: Sequence[PostSchema]) -> None: Replace the displayed posts with a diff.
+        add_post(post: PostSchema) -> None: Append a post.
+        remove_post(post_id: int) -> bool: Remove a displayed post by id.
+        post_id(row: int) -> int: Get the id of the post displayed in a row.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._ids = array("q")
+        self._user_ids = array("q")
+        self._titles: list[str] = []
+        self._bodies: list[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = index.row()
+        match index.column():
+            case 0:
+                return str(self._ids[row])
+            case 1:
+                return str(self._user_ids[row])
+            case 2:
+                return self._titles[row]
+            case 3:
+                return self._bodies[row]
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return str(section + 1)
+
+    def post_id(self, row: int) -> int:
+        """
+        Get the id of the post displayed in a row.
+
+        Args:
+            row (int): The row of the post.
+
+        Returns:
+            int: The id of the post.
+        """
+        return self._ids[row]
+
+    def add_post(self, post: PostSchema) -> None:
+        """
+        Append a post to the table.
+
+        Args:
+            post (PostSchema): The post to append.
+        """
+        row = len(self._ids)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._insert(row, [post])
+        self.endInsertRows()
+
+    def remove_post(self, post_id: int) -> bool:
+        """
+        Remove a displayed post by id.
+
+        Args:
+            post_id (int): The id of the post to remove.
+
+        Returns:
+            bool: True if the post was displayed and removed, False otherwise.
+        """
+        row = self._row(post_id)
+        if row is None:
+            return False
+        self._remove_rows(row, row)
+        return True
+
+    def set_posts(self, posts: Sequence[PostSchema]) -> None:
+        """
+        Replace the displayed posts, notifying the view only about rows that changed.
+
+        Rows of posts that disappeared are removed, new posts are inserted in place and
+        posts with changed fields are updated. If the order of the remaining posts changed,
+        the model is reset instead.
+
+        Args:
+            posts (Sequence[PostSchema]): The posts to display.
+        """
+        new_rows = {post.id: row for row, post in enumerate(posts)}
+
+        end = len(self._ids)
+        while end > 0:
+            if self._ids[end - 1] in new_rows:
+                end -= 1
+                continue
+            start = end - 1
+            while start > 0 and self._ids[start - 1] not in new_rows:
+                start -= 1
+            self._remove_rows(start, end - 1)
+            end = start
+
+        previous = -1
+        for post_id in self._ids:
+            if new_rows[post_id] < previous:
+                self._reset(posts)
+                return
+            previous = new_rows[post_id]
+
+        row = 0
+        changed: list[int] = []
+        pending: list[PostSchema] = []
+        for post in posts:
+            if row < len(self._ids) and self._ids[row] == post.id:
+                row = self._insert_pending(row, pending)
+                if self._set(row, post):
+                    changed.append(row)
+                row += 1
+            else:
+                pending.append(post)
+        self._insert_pending(row, pending)
+
+        for start, end in _ranges(changed):
+            self._emit_changed(start, end)
+
+    def _insert_pending(self, row: int, pending: list[PostSchema]) -> int:
+        """Insert pending posts at a row, clear them and return the row after them."""
+        if not pending:
+            return row
+        self.beginInsertRows(QModelIndex(), row, row + len(pending) - 1)
+        self._insert(row, pending)
+        self.endInsertRows()
+        row += len(pending)
+        pending.clear()
+        return row
+
+    def _reset(self, posts: Sequence[PostSchema]) -> None:
+        """Replace all the columns at once."""
+        self.beginResetModel()
+        self._ids = array("q", (post.id for post in posts))
+        self._user_ids = array("q", (post.user_id for post in posts))
+        self._titles = [post.title for post in posts]
+        self._bodies = [post.body for post in posts]
+        self.endResetModel()
+
+    def _insert(self, row: int, posts: Sequence[PostSchema]) -> None:
+        self._ids[row:row] = array("q", (post.id for post in posts))
+        self._user_ids[row:row] = array("q", (post.user_id for post in posts))
+        self._titles[row:row] = [post.title for post in posts]
+        self._bodies[row:row] = [post.body for post in posts]
+
+    def _set(self, row: int, post: PostSchema) -> bool:
+        """Set the fields of a row and return whether any of them changed."""
+        if (
+            self._user_ids[row] == post.user_id
+            and self._titles[row] == post.title
+            and self._bodies[row] == post.body
+        ):
+            return False
+        self._user_ids[row] = post.user_id
+        self._titles[row] = post.title
+        self._bodies[row] = post.body
+        return True
+
+    def _remove_rows(self, first: int, last: int) -> None:
+        self.beginRemoveRows(QModelIndex(), first, last)
+        del self._ids[first : last + 1]
+        del self._user_ids[first : last + 1]
+        del self._titles[first : last + 1]
+        del self._bodies[first : last + 1]
+        self.endRemoveRows()
+
+    def _row(self, post_id: int) -> int | None:
+        try:
+            return self._ids.index(post_id)
+        except ValueError:
+            return None
+
+    def _emit_changed(self, first: int, last: int) -> None:
+        self.dataChanged.emit(
+            self.index(first, 1),
+            self.index(last, len(HEADERS) - 1),
+            [Qt.ItemDataRole.DisplayRole],
+        )
+
+
+def _ranges(rows: Iterable[int]) -> Iterable[tuple[int, int]]:
+    """Group ascending row numbers into (first, last) ranges of consecutive rows."""
+    first = last = None
+    for row in rows:
+        if last is not None and row == last + 1:
+            last = row
+            continue
+        if first is not None and last is not None:
+            yield first, last
+        first = last = row
+    if first is not None and last is not None:
+        yield first, last
@@ -0,0 +1,58 @@
+"""
+Benchmark PostRepository.find_all with and without validation of the read rows.
+
+Run from the lab5 directory:
+    python -m benchmarks.find_all --rows 100000 --repeat 5
+"""
+
+import time
+import asyncio
+import argparse
+
+from loguru import logger
+
+from store import PostRepository, setup_db
+from schemas import PostAddSchema
+from store.database import engine
+
+
+async def seed(rows: int) -> None:
+    """Fill the database with synthetic posts."""
+    await setup_db()
+    await PostRepository.add_many(
+        [
+            PostAddSchema(user_id=i % 10, title=f"Post title {i}", body=f"Post body {i}")
+            for i in range(rows)
+        ]
+    )
+
+
+async def measure(validate: bool, repeat: int) -> float:
+    """Return the best find_all throughput in rows per second."""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        posts = await PostRepository.find_all(validate=validate)
+        elapsed = time.perf_counter() - start
+        best = max(best, len(posts) / elapsed)
+    return best
+
+
+async def main(rows: int, repeat: int) -> None:
+    logger.disable("store")
+    await seed(rows)
+    validated = await measure(True, repeat)
+    trusted = await measure(False, repeat)
+    await engine.dispose()
+
+    print(f"find_all over {rows} rows, best of {repeat}:")
+    print(f"  validate=True:  {validated:>12,.0f} rows/s")
+    print(f"  validate=False: {trusted:>12,.0f} rows/s ({trusted / validated:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Number of posts.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs.")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,88 @@
+"""
+Benchmark PostRepository overhead with logging disabled and enabled.
+
+Run from the lab5 directory:
+    python -m benchmarks.logging_overhead --ops 5000 --repeat 3
+"""
+
+import time
+import asyncio
+import argparse
+
+from loguru import logger
+
+from store import PostRepository, setup_db
+from schemas import PostAddSchema
+from store.database import engine
+
+MODES = ("off", "INFO", "DEBUG")
+
+
+def configure(mode: str) -> None:
+    """Disable logging or send it to an enqueued sink that drops it at the given level."""
+    logger.remove()
+    if mode == "off":
+        logger.disable("store")
+        return
+    logger.enable("store")
+    logger.add(lambda message: None, level=mode, enqueue=True)
+
+
+async def measure(ops: int) -> dict[str, float]:
+    """Return add_one, find_one and find_all throughput in operations per second."""
+    await setup_db()
+    start = time.perf_counter()
+    for i in range(ops):
+        await PostRepository.add_one(
+            PostAddSchema(user_id=i % 10, title=f"Post title {i}", body=f"Post body {i}")
+        )
+    added = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(1, ops + 1):
+        await PostRepository.find_one(i)
+    found = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ops // 100):
+        await PostRepository.find_all(limit=10, validate=False)
+    listed = time.perf_counter() - start
+    return {
+        "add_one": ops / added,
+        "find_one": ops / found,
+        "find_all": (ops // 100) / listed,
+    }
+
+
+async def main(ops: int, repeat: int) -> None:
+    results = {}
+    for mode in MODES:
+        configure(mode)
+        runs = [await measure(ops) for _ in range(repeat)]
+        results[mode] = {name: max(run[name] for run in runs) for name in runs[0]}
+        await logger.complete()
+    await engine.dispose()
+
+    print(f"PostRepository with {ops} operations, best of {repeat}, ops/s:")
+    print(f"  {'logging':<8}" + "".join(f"{name:>12}" for name in results["off"]))
+    for mode, result in results.items():
+        row = "".join(f"{rate:>12,.0f}" for rate in result.values())
+        print(f"  {mode:<8}{row}")
+    for mode in MODES[1:]:
+        overhead = [
+            results["off"][name] / results[mode][name] - 1 for name in results[mode]
+        ]
+        print(
+            f"  {mode} overhead: "
+            + ", ".join(
+                f"{name} {value:+.1%}" for name, value in zip(results[mode], overhead)
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ops", type=int, default=5000, help="Number of operations.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs.")
+    args = parser.parse_args()
+    asyncio.run(main(args.ops, args.repeat))
@@ -0,0 +1,271 @@
+"""
+Benchmark PostRepository operations at several dataset sizes and storage backends.
+
+Every backend and size runs in a fresh interpreter, because the database engine is
+configured once at import. Results are printed as a table and saved as JSON, so runs
+can be compared.
+
+Run from the lab5 directory:
+    python -m benchmarks.repository --sizes 10000 100000 1000000 --samples 1000
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from typing import Any
+from pathlib import Path
+from collections.abc import Callable, Iterator, Awaitable
+
+from schemas import PostSchema, PostAddSchema
+
+LAB_ROOT = Path(__file__).resolve().parents[1]
+BACKENDS = ("memory", "file")
+SEED_BATCH_SIZE = 10_000
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud"
+).split()
+
+
+def generate_posts(count: int, seed: int = 0, start: int = 0) -> Iterator[PostAddSchema]:
+    """
+    Generate synthetic posts.
+
+    Args:
+        count (int): Number of posts.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+        start (int, optional): Number of the first post, included in its title.
+            Defaults to 0.
+
+    Yields:
+        PostAddSchema: The next post.
+    """
+    rng = random.Random(seed)
+    for number in range(start, start + count):
+        yield PostAddSchema(
+            user_id=rng.randint(1, 100),
+            title=f"{' '.join(rng.choices(WORDS, k=4))} {number}",
+            body=" ".join(rng.choices(WORDS, k=30)),
+        )
+
+
+def summarize(latencies: list[float], items: int | None = None) -> dict[str, float]:
+    """
+    Summarize the latencies of an operation.
+
+    Args:
+        latencies (list[float]): Seconds taken by every call.
+        items (int | None, optional): Rows processed by all calls, for bulk operations.
+            Defaults to None (one row per call).
+
+    Returns:
+        dict[str, float]: Calls, throughput in rows per second and latency percentiles
+            in milliseconds.
+    """
+    total = sum(latencies)
+    ordered = sorted(latencies)
+    quantiles = (
+        statistics.quantiles(ordered, n=100, method="inclusive")
+        if len(ordered) > 1
+        else ordered * 99
+    )
+    return {
+        "calls": len(latencies),
+        "rows": items if items is not None else len(latencies),
+        "throughput": (items if items is not None else len(latencies)) / total,
+        "p50_ms": quantiles[49] * 1000,
+        "p90_ms": quantiles[89] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+async def time_calls(
+    operation: Callable[[Any], Awaitable[Any]], arguments: list[Any]
+) -> list[float]:
+    """Call an operation with every argument in turn and return the latency of each."""
+    latencies = []
+    for argument in arguments:
+        start = time.perf_counter()
+        await operation(argument)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_size(rows: int, samples: int, scan_samples: int) -> dict[str, Any]:
+    """Seed the database with rows posts and time every repository operation."""
+    from loguru import logger
+
+    # The store is imported here, after the parent process has chosen the database.
+    from store import PostRepository, close_db, setup_db
+
+    logger.disable("store")
+    await setup_db()
+    rng = random.Random(rows)
+    results = {}
+
+    batches = []
+    posts = generate_posts(rows)
+    for start in range(0, rows, SEED_BATCH_SIZE):
+        batches.append([next(posts) for _ in range(min(SEED_BATCH_SIZE, rows - start))])
+    results["add_many"] = summarize(
+        await time_calls(PostRepository.add_many, batches), rows
+    )
+    del batches
+
+    extra = list(generate_posts(samples, seed=1, start=rows))
+    results["add_one"] = summarize(await time_calls(PostRepository.add_one, extra))
+    results["lazy_add"] = summarize(
+        await time_calls(PostRepository.lazy_add, extra[:scan_samples])
+    )
+    total = rows + samples
+
+    repeat = max(1, min(5, 1_000_000 // total))
+    for name, validate in (("find_all", True), ("find_all_trusted", False)):
+        latencies = await time_calls(
+            lambda _: PostRepository.find_all(validate=validate), [None] * repeat
+        )
+        results[name] = summarize(latencies, total * repeat)
+
+    ids = [rng.randint(1, rows) for _ in range(samples)]
+    results["find_one"] = summarize(await time_calls(PostRepository.find_one, ids))
+    titles = [str(post_id) for post_id in ids]
+    results["find_by_title"] = summarize(
+        await time_calls(PostRepository.find_by_title, titles[:scan_samples])
+    )
+    updates = [
+        PostSchema(id=post_id, user_id=1, title=f"updated {post_id}", body="updated")
+        for post_id in ids
+    ]
+    results["update_one"] = summarize(
+        await time_calls(PostRepository.update_one, updates)
+    )
+    deletes = rng.sample(range(1, rows + 1), min(samples, rows))
+    results["delete_one"] = summarize(
+        await time_calls(PostRepository.delete_one, deletes)
+    )
+
+    await close_db()
+    return results
+
+
+def child(rows: int, samples: int, scan_samples: int) -> None:
+    """Run the benchmark of the configured database and print the results as JSON."""
+    print(json.dumps(asyncio.run(run_size(rows, samples, scan_samples))))
+
+
+def run_child(backend: str, rows: int, samples: int, scan_samples: int) -> dict[str, Any]:
+    """Run the benchmark of one backend and size in a fresh interpreter."""
+    with tempfile.TemporaryDirectory() as directory:
+        database = (
+            "sqlite+aiosqlite:///:memory:"
+            if backend == "memory"
+            else f"sqlite+aiosqlite:///{directory}/posts.db"
+        )
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.repository",
+                "--child",
+                "--sizes",
+                str(rows),
+                "--samples",
+                str(samples),
+                "--scan-samples",
+                str(scan_samples),
+            ],
+            cwd=LAB_ROOT,
+            env={**os.environ, "DATABASE_CONNECTION": database},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    results: dict[str, Any] = json.loads(output.strip().splitlines()[-1])
+    return results
+
+
+def main(
+    sizes: list[int],
+    backends: list[str],
+    samples: int,
+    scan_samples: int,
+    output: Path,
+) -> None:
+    runs = []
+    for backend in backends:
+        for rows in sizes:
+            print(f"Running {backend} database with {rows:,} rows...", flush=True)
+            results = run_child(backend, rows, samples, scan_samples)
+            runs.append({"backend": backend, "rows": rows, "results": results})
+
+            print(
+                f"  {'operation':<17}{'calls':>7}{'rows/s':>14}"
+                f"{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+            )
+            for name, result in results.items():
+                print(
+                    f"  {name:<17}{result['calls']:>7}{result['throughput']:>14,.0f}"
+                    f"{result['p50_ms']:>10.3f}{result['p90_ms']:>10.3f}"
+                    f"{result['p99_ms']:>10.3f}{result['max_ms']:>10.3f}"
+                )
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "samples": samples,
+        "scan_samples": scan_samples,
+        "runs": runs,
+    }
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Numbers of posts to seed the database with.",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        default=list(BACKENDS),
+        help="SQLite storage backends.",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=1000, help="Calls of single-row operations."
+    )
+    parser.add_argument(
+        "--scan-samples",
+        type=int,
+        default=100,
+        help="Calls of operations that may scan the table (lazy_add, find_by_title).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path(f"repository-{time.strftime('%Y%m%d-%H%M%S')}.json"),
+        help="File to save the JSON results in.",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.sizes[0], args.samples, args.scan_samples)
+    else:
+        main(args.sizes, args.backends, args.samples, args.scan_samples, args.output)
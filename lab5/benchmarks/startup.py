@@ -0,0 +1,154 @@
+"""
+Measure application startup time and enforce a budget for showing the window.
+
+Every run starts a fresh interpreter, imports the entry point and runs the application
+through app.run until the first posts are loaded, timing each step from interpreter
+start. The command fails if the median time to the window exceeds the budget or if the
+database or HTTP stack was imported before the window was shown.
+
+Run from the lab5 directory:
+    python -m benchmarks.startup --repeat 5 --budget 1.0 --imports 15
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from typing import Any
+from pathlib import Path
+
+LAB_ROOT = Path(__file__).resolve().parents[1]
+STEPS = ("import", "window", "loaded")
+# Packages that must not be imported before the window is shown.
+DEFERRED = ("store", "http_client")
+
+
+def child() -> None:
+    """Run the application through app.run and print the step times as JSON."""
+    # Interpreter startup up to this point is included by measuring from process start.
+    started = time.time() - _process_uptime()
+    from loguru import logger
+
+    logger.remove()
+    from PyQt5.QtWidgets import QApplication
+
+    import app
+    import main
+    from app.main_window import MainWindow
+
+    times = {"import": time.time() - started}
+    imported: list[str] = []
+
+    async def on_startup() -> None:
+        # app.run calls this right after showing the window.
+        QApplication.processEvents()
+        times["window"] = time.time() - started
+        imported.extend(module for module in DEFERRED if module in sys.modules)
+        window = next(
+            widget
+            for widget in QApplication.topLevelWidgets()
+            if isinstance(widget, MainWindow)
+        )
+        window.posts_loaded.connect(lambda: posts_loaded(window))
+        await main.startup()
+
+    def posts_loaded(window: MainWindow) -> None:
+        times["loaded"] = time.time() - started
+        # Closing the last window quits the application like a user would.
+        window.close()
+
+    app.run(on_startup=on_startup, on_shutdown=main.shutdown)
+    print(json.dumps({"times": times, "imported": imported}))
+
+
+def _process_uptime() -> float:
+    """Seconds since this process was started, from /proc where available."""
+    try:
+        ticks = int(Path("/proc/self/stat").read_text().rsplit(")", 1)[1].split()[19])
+        boot = float(Path("/proc/uptime").read_text().split()[0])
+        return boot - ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def run_child() -> dict[str, Any]:
+    """Run one measurement in a fresh interpreter."""
+    env = {
+        **os.environ,
+        "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen"),
+    }
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--child"],
+        cwd=LAB_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result: dict[str, Any] = json.loads(output.strip().splitlines()[-1])
+    return result
+
+
+def slowest_imports(count: int) -> list[tuple[int, str]]:
+    """Return the modules imported by main with the largest cumulative import time."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=LAB_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main(repeat: int, budget: float, imports: int) -> int:
+    runs = [run_child() for _ in range(repeat)]
+    medians = {
+        step: statistics.median(run["times"][step] for run in runs) for step in STEPS
+    }
+
+    print(f"Startup from interpreter start, median of {repeat} runs:")
+    for step in STEPS:
+        print(f"  {step:<7} {medians[step] * 1000:>8.1f} ms")
+    if imports:
+        print("Slowest imports of the entry point (cumulative):")
+        for cumulative, name in slowest_imports(imports):
+            print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+    failed = False
+    if medians["window"] > budget:
+        print(f"FAIL: window shown after {medians['window']:.3f}s, budget {budget:.3f}s")
+        failed = True
+    for module in DEFERRED:
+        if any(module in run["imported"] for run in runs):
+            print(f"FAIL: {module} was imported before the window was shown")
+            failed = True
+    if not failed:
+        print(f"OK: window shown within the {budget:.3f}s budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs.")
+    parser.add_argument(
+        "--budget", type=float, default=1.0, help="Seconds allowed to show the window."
+    )
+    parser.add_argument(
+        "--imports", type=int, default=10, help="Number of slowest imports to list."
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+    else:
+        sys.exit(main(args.repeat, args.budget, args.imports))
@@ -1,3 +1,5 @@
+from .log import LogSampler, setup_logging
 from .config import settings
+from .json_stream import JSONArrayDecoder
 
-__all__ = ["settings"]
+__all__ = ["settings", "setup_logging", "LogSampler", "JSONArrayDecoder"]
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,12 +10,78 @@ class Settings(BaseSettings):
     Attributes:
         ENV (str): The environment to run the application in.
         BASE_URL (str): The base URL for the application.
-        DATABASE_CONNECTION (str): The database connection string.
+        DATABASE_CONNECTION (str): The database connection string. An in-memory database
+            is recreated on every start, a file database is created if missing and migrated.
+        DATABASE_POOL_SIZE (int): Number of connections kept open to a file database.
+        DATABASE_MAX_OVERFLOW (int): Number of connections allowed above the pool size.
+        DATABASE_POOL_TIMEOUT (float): Seconds to wait for a free pooled connection.
+        SQLITE_JOURNAL_MODE (str): SQLite journal_mode pragma.
+        SQLITE_SYNCHRONOUS (str): SQLite synchronous pragma.
+        SQLITE_CACHE_SIZE (int): SQLite cache_size pragma, negative values are in KiB.
+        SQLITE_MMAP_SIZE (int): SQLite mmap_size pragma in bytes.
+        SQLITE_TEMP_STORE (str): SQLite temp_store pragma.
+        SQLITE_BUSY_TIMEOUT (int): SQLite busy_timeout pragma in milliseconds.
+        DATABASE_PROFILE (bool): Whether to profile SQL statements.
+        DATABASE_SLOW_QUERY_MS (float): Milliseconds after which a profiled statement is
+            logged with its query plan.
+        DATABASE_PROFILE_REPORT (str | None): File to save the JSON query profile in when
+            the database is closed.
+        HTTP_CACHE_TTL (float): Seconds a cached HTTP response stays fresh.
+        HTTP_CACHE_MAX_ENTRIES (int): Maximum number of cached HTTP responses.
+        HTTP_CACHE_PATH (str | None): SQLite file to persist cached HTTP responses in.
+        HTTP_POOL_LIMIT (int): Maximum number of open HTTP connections.
+        HTTP_POOL_LIMIT_PER_HOST (int): Maximum number of open HTTP connections per host.
+        HTTP_KEEPALIVE_TIMEOUT (float): Seconds an idle HTTP connection is kept open.
+        HTTP_DNS_CACHE_TTL (int): Seconds resolved host names are cached.
+        HTTP_TIMEOUT (float): Total timeout of an HTTP request in seconds.
+        HTTP_CONNECT_TIMEOUT (float): Timeout of opening an HTTP connection in seconds.
+        HTTP_STREAM_READ_TIMEOUT (float): Timeout of reading the next chunk of a streamed
+            HTTP response in seconds. Streamed responses have no total timeout.
+        HTTP_RETRIES (int): Number of retries of a failed HTTP request.
+        HTTP_RETRY_BACKOFF (float): Delay before the first HTTP retry in seconds.
+        HTTP_CONCURRENCY (int): Maximum number of requests of one HTTP client in flight.
+        HTTP_PAGE_LIMIT (int): Number of items per page of paginated HTTP requests.
+        LOG_LEVEL (str): Minimum level of logged messages.
+        LOG_ENQUEUE (bool): Whether to write log messages from a background thread.
+        LOG_JSON (bool): Whether to write log messages as JSON objects.
+        LOG_SAMPLE_EVERY (int): Log one of this many messages logged once per row.
     """
 
     ENV: str = "dev"
     BASE_URL: str = "https://jsonplaceholder.typicode.com"
     DATABASE_CONNECTION: str = "sqlite+aiosqlite:///:memory:"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    SQLITE_JOURNAL_MODE: Literal[
+        "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"
+    ] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -65536
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    SQLITE_BUSY_TIMEOUT: int = 5000
+    DATABASE_PROFILE: bool = False
+    DATABASE_SLOW_QUERY_MS: float = 50
+    DATABASE_PROFILE_REPORT: str | None = None
+    HTTP_CACHE_TTL: float = 300
+    HTTP_CACHE_MAX_ENTRIES: int = 128
+    HTTP_CACHE_PATH: str | None = None
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 10
+    HTTP_KEEPALIVE_TIMEOUT: float = 30
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_TIMEOUT: float = 30
+    HTTP_CONNECT_TIMEOUT: float = 10
+    HTTP_STREAM_READ_TIMEOUT: float = 30
+    HTTP_RETRIES: int = 3
+    HTTP_RETRY_BACKOFF: float = 0.5
+    HTTP_CONCURRENCY: int = 4
+    HTTP_PAGE_LIMIT: int = 20
+    LOG_LEVEL: str = "INFO"
+    LOG_ENQUEUE: bool = True
+    LOG_JSON: bool = False
+    LOG_SAMPLE_EVERY: int = 100
 
     model_config = SettingsConfigDict(env_file=".env", extra="allow")
 
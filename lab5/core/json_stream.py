@@ -0,0 +1,96 @@
+import json
+import codecs
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_TAIL = "0123456789.eE+-"
+
+
+class JSONArrayDecoder:
+    """
+    Incremental decoder of a JSON array.
+
+    Chunks of the document are fed as they arrive and every element is returned as soon
+    as it is complete, so a large array never has to be held in memory as a whole.
+
+    Methods:
+        feed(chunk: bytes) -> list[Any]: Decode the elements completed by a chunk.
+        close() -> None: Check that the whole array was decoded.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._empty = True
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Decode the elements completed by a chunk.
+
+        Args:
+            chunk (bytes): The next chunk of the document.
+
+        Returns:
+            list[Any]: The elements completed by the chunk, possibly none.
+
+        Raises:
+            ValueError: If the document is not a JSON array.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        items: list[Any] = []
+        position = self._skip_whitespace(0)
+
+        if not self._started:
+            if position == len(self._buffer):
+                self._buffer = ""
+                return items
+            if self._buffer[position] != "[":
+                raise ValueError("JSON document is not an array")
+            self._started = True
+            position = self._skip_whitespace(position + 1)
+
+        while not self._finished and position < len(self._buffer):
+            if self._empty and self._buffer[position] == "]":
+                self._finished = True
+                position += 1
+                break
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, position)
+            except json.JSONDecodeError:
+                break
+            # An element is only complete when the delimiter after it has arrived,
+            # otherwise a number like 12 could still turn out to be 12.5 or 123.
+            delimiter = self._skip_whitespace(end)
+            if delimiter == len(self._buffer) or self._buffer[delimiter] in _NUMBER_TAIL:
+                break
+            if self._buffer[delimiter] == "]":
+                self._finished = True
+            elif self._buffer[delimiter] != ",":
+                raise ValueError(f"Unexpected {self._buffer[delimiter]!r} in JSON array")
+            items.append(item)
+            self._empty = False
+            position = self._skip_whitespace(delimiter + 1)
+
+        self._buffer = self._buffer[position:]
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole array was decoded.
+
+        Raises:
+            ValueError: If the document ended before the end of the array.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        if not self._finished:
+            raise ValueError("JSON array is incomplete")
+        if self._buffer.strip(_WHITESPACE):
+            raise ValueError("Extra data after JSON array")
+
+    def _skip_whitespace(self, position: int) -> int:
+        while position < len(self._buffer) and self._buffer[position] in _WHITESPACE:
+            position += 1
+        return position
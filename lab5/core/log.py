@@ -0,0 +1,50 @@
+import sys
+import itertools
+
+from loguru import logger
+
+from .config import settings
+
+
+def setup_logging() -> None:
+    """
+    Configure the application log sink from the settings.
+
+    Records are formatted and written by a background thread when LOG_ENQUEUE is set, so
+    logging from the event loop never waits for the terminal. With LOG_JSON every record
+    is written as a JSON object including the structured fields passed to the logger.
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.LOG_LEVEL,
+        enqueue=settings.LOG_ENQUEUE,
+        serialize=settings.LOG_JSON,
+        backtrace=False,
+    )
+
+
+class LogSampler:
+    """
+    Lets one of every few messages through, for messages logged once per row.
+
+    Args:
+        every (int | None, optional): Let through one message of this many.
+            Defaults to settings.LOG_SAMPLE_EVERY.
+
+    Methods:
+        __call__() -> bool: Check whether the next message should be logged.
+    """
+
+    def __init__(self, every: int | None = None) -> None:
+        self.every = max(1, settings.LOG_SAMPLE_EVERY if every is None else every)
+        self._counter = itertools.count()
+
+    def __call__(self) -> bool:
+        """
+        Check whether the next message should be logged.
+
+        Returns:
+            bool: True for the first message and then for every `every`-th one.
+        """
+        return next(self._counter) % self.every == 0
@@ -0,0 +1,218 @@
+"""
+Export posts from the database to an NDJSON, CSV or Parquet file without the GUI.
+
+Posts are streamed from the database in batches and written as they arrive, so memory
+use does not depend on the number of posts. Parquet export requires pyarrow, which is
+not a dependency of the application and has to be installed separately.
+
+Export the posts of user 1 with "lorem" in the title, e.g.:
+    DATABASE_CONNECTION=sqlite+aiosqlite:///posts.db python export.py posts.csv \\
+        --user-id 1 --title lorem
+"""
+
+import csv
+import json
+import time
+import asyncio
+import argparse
+from typing import Any
+from pathlib import Path
+
+from loguru import logger
+
+from core import setup_logging
+from store import PostRepository, close_db, setup_db
+from schemas import PostSchema
+
+FORMATS = ("ndjson", "csv", "parquet")
+FIELDS = ("id", "user_id", "title", "body")
+
+
+class NDJSONWriter:
+    """Writer of posts as one JSON object per line."""
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("w", encoding="utf-8")
+
+    def write(self, posts: list[PostSchema]) -> None:
+        self._file.writelines(
+            json.dumps(
+                {
+                    "id": post.id,
+                    "user_id": post.user_id,
+                    "title": post.title,
+                    "body": post.body,
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            for post in posts
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CSVWriter:
+    """Writer of posts as CSV with a header row."""
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(FIELDS)
+
+    def write(self, posts: list[PostSchema]) -> None:
+        self._writer.writerows(
+            (post.id, post.user_id, post.title, post.body) for post in posts
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """Writer of posts as a Parquet file with a row group per batch."""
+
+    def __init__(self, path: Path) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet export requires pyarrow: pip install pyarrow")
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.int64()),
+                ("user_id", pa.int64()),
+                ("title", pa.string()),
+                ("body", pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, posts: list[PostSchema]) -> None:
+        columns = [
+            [post.id for post in posts],
+            [post.user_id for post in posts],
+            [post.title for post in posts],
+            [post.body for post in posts],
+        ]
+        self._writer.write_batch(self._pa.record_batch(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+WRITERS: dict[str, Any] = {
+    "ndjson": NDJSONWriter,
+    "csv": CSVWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def detect_format(path: Path) -> str:
+    """Guess the export format from the file extension."""
+    suffix = path.suffix.lower().lstrip(".")
+    if suffix in ("ndjson", "jsonl", "json"):
+        return "ndjson"
+    if suffix in ("parquet", "pq"):
+        return "parquet"
+    return "csv"
+
+
+async def export(
+    path: Path,
+    file_format: str,
+    batch_size: int,
+    user_id: int | None,
+    title: str | None,
+    progress_interval: float,
+) -> int:
+    """
+    Export posts to a file.
+
+    Args:
+        path (Path): The file to write.
+        file_format (str): "ndjson", "csv", "parquet" or "auto".
+        batch_size (int): Posts read and written at a time.
+        user_id (int | None): Only export posts of this user.
+        title (str | None): Only export posts with this substring in the title.
+        progress_interval (float): Seconds between progress reports.
+
+    Returns:
+        int: The number of exported posts.
+    """
+    if file_format == "auto":
+        file_format = detect_format(path)
+    await setup_db()
+
+    writer = WRITERS[file_format](path)
+    started = last_report = time.perf_counter()
+    exported = 0
+    try:
+        async for posts in PostRepository.stream_batches(
+            batch_size, user_id=user_id, title=title
+        ):
+            writer.write(posts)
+            exported += len(posts)
+            if time.perf_counter() - last_report >= progress_interval:
+                last_report = time.perf_counter()
+                logger.info(
+                    "Exported {exported} posts ({rate:,.0f} rows/s).",
+                    exported=exported,
+                    rate=exported / (last_report - started),
+                )
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    logger.success(
+        "Exported {exported} posts to {path} in {elapsed:.1f}s ({rate:,.0f} rows/s).",
+        exported=exported,
+        path=path,
+        elapsed=elapsed,
+        rate=exported / max(elapsed, 1e-9),
+    )
+    return exported
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        await export(
+            args.path,
+            args.format,
+            args.batch_size,
+            args.user_id,
+            args.title,
+            args.progress_interval,
+        )
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", type=Path, help="File to export the posts to.")
+    parser.add_argument(
+        "--format",
+        choices=("auto", *FORMATS),
+        default="auto",
+        help="File format, by default guessed from the extension.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=10_000, help="Posts read at a time."
+    )
+    parser.add_argument("--user-id", type=int, help="Only export posts of this user.")
+    parser.add_argument("--title", help="Only export posts with this title substring.")
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between progress reports.",
+    )
+    args = parser.parse_args()
+    setup_logging()
+    logger.disable("store")
+    asyncio.run(main(args))
+    logger.complete()
@@ -1,3 +1,12 @@
 from .jp import JPHTTPClient
+from .cache import CacheStats, CacheEntry, ResponseCache
+from .session import get_session, close_session
 
-__all__ = ["JPHTTPClient"]
+__all__ = [
+    "JPHTTPClient",
+    "ResponseCache",
+    "CacheEntry",
+    "CacheStats",
+    "get_session",
+    "close_session",
+]
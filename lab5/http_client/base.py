@@ -1,21 +1,58 @@
+import asyncio
 from types import TracebackType
-from typing import Self
+from typing import Any, Self
+from collections.abc import Mapping, AsyncGenerator
 
 from loguru import logger
-from aiohttp import ClientSession
+from aiohttp import ClientTimeout, ClientResponse, ClientConnectionError
+
+from core import JSONArrayDecoder, settings
+
+from .cache import CacheEntry, ResponseCache
+from .session import get_session
+
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class HTTPClient:
     """
     Base class for HTTP clients.
 
+    Requests go through the application-wide session from get_session, so clients are
+    cheap to create and reuse pooled connections. Server errors (5xx), connection errors
+    and timeouts are retried with exponential backoff.
+
     Args:
         base_url (str): The base URL of the HTTP client.
         headers (dict[str, Any] | None, optional): Additional headers to include in requests.
+        cache (ResponseCache | None, optional): Cache of JSON responses shared between
+            clients. Defaults to None (no caching).
+        retries (int | None, optional): Number of retries of a failed request.
+            Defaults to settings.HTTP_RETRIES.
+        backoff (float | None, optional): Delay before the first retry in seconds, doubled
+            for every next one. Defaults to settings.HTTP_RETRY_BACKOFF.
+        concurrency (int | None, optional): Maximum number of requests of this client in
+            flight at once. Defaults to settings.HTTP_CONCURRENCY.
     """
 
-    def __init__(self, base_url: str, headers: dict[str, str] | None = None) -> None:
-        self._session = ClientSession(base_url=base_url, headers=headers)
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str] | None = None,
+        cache: ResponseCache | None = None,
+        retries: int | None = None,
+        backoff: float | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._headers = headers
+        self._session = get_session()
+        self._cache = cache
+        self._retries = settings.HTTP_RETRIES if retries is None else retries
+        self._backoff = settings.HTTP_RETRY_BACKOFF if backoff is None else backoff
+        self._semaphore = asyncio.Semaphore(
+            settings.HTTP_CONCURRENCY if concurrency is None else concurrency
+        )
 
     async def __aenter__(self) -> Self:
         return self
@@ -26,15 +63,217 @@ class HTTPClient:
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        exc_msg = ""
-        if exc_type is not None:
-            exc_msg += f" type: {exc_type.__name__}"
-        if exc_value is not None:
-            exc_msg += f" value: {exc_value}"
-        if traceback is not None:
-            exc_msg += f" traceback: {traceback}"
-        if exc_msg != "":
-            exc_msg = f" with exception: {exc_msg}"
-        logger.info(f"Closing session for {self._session._base_url}{exc_msg}.")
-        if self._session is not None:
-            await self._session.close()
+        if exc_value is None:
+            logger.debug("Releasing client for {base_url}.", base_url=self._base_url)
+            return
+        logger.warning(
+            "Releasing client for {base_url} after {error!r}.",
+            base_url=self._base_url,
+            error=exc_value,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> ClientResponse:
+        """
+        Send a request, retrying server errors, connection errors and timeouts.
+
+        At most concurrency requests of the client are in flight at once; the limit is not
+        held while waiting for a retry.
+
+        The body of the returned response is already read, so its connection is back in
+        the pool and the response can be decoded with json() or text(). A streamed
+        response is returned as soon as its headers arrive instead, and its request keeps
+        counting towards the concurrency limit until the caller passes it to
+        _release_stream.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The path of the resource.
+            params (Mapping[str, Any] | None, optional): The query parameters.
+            headers (Mapping[str, str] | None, optional): Additional request headers.
+            stream (bool, optional): Whether to leave the body unread and use the
+                streaming timeout. Defaults to False.
+
+        Returns:
+            ClientResponse: The response of the last attempt.
+        """
+        url = f"{self._base_url}{path}"
+        request_headers = {**(self._headers or {}), **(headers or {})}
+        timeout = _stream_timeout() if stream else None
+        attempt = 0
+        while True:
+            try:
+                await self._semaphore.acquire()
+                keep_slot = False
+                try:
+                    response = await self._session.request(
+                        method,
+                        url,
+                        params=params,
+                        headers=request_headers,
+                        timeout=timeout,
+                    )
+                    if response.status < 500 or attempt >= self._retries:
+                        if stream:
+                            keep_slot = True
+                        else:
+                            await response.read()
+                        return response
+                    response.release()
+                finally:
+                    if not keep_slot:
+                        self._semaphore.release()
+                reason = f"status {response.status}"
+            except (ClientConnectionError, asyncio.TimeoutError) as exc:
+                if attempt >= self._retries:
+                    raise
+                reason = repr(exc)
+
+            delay = self._backoff * 2**attempt
+            logger.warning(
+                "{method} {url} failed with {reason}, retrying in {delay}s.",
+                method=method,
+                url=url,
+                reason=reason,
+                delay=delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _release_stream(self, response: ClientResponse) -> None:
+        """Release a streamed response and its slot of the concurrency limit."""
+        response.release()
+        self._semaphore.release()
+
+    async def _get_json(self, path: str, params: Mapping[str, Any] | None = None) -> Any:
+        """
+        Send a GET request and decode the JSON response, using the cache if there is one.
+
+        Fresh cached responses are returned without a request. Stale ones are revalidated
+        with If-None-Match/If-Modified-Since and reused on 304 Not Modified.
+
+        Args:
+            path (str): The path of the resource.
+            params (Mapping[str, Any] | None, optional): The query parameters.
+
+        Returns:
+            Any: The decoded JSON body.
+        """
+        if self._cache is None:
+            response = await self._request("GET", path, params=params)
+            response.raise_for_status()
+            return await response.json()
+
+        key = self._cache.key(f"{self._base_url}{path}", params)
+        entry = self._cache.get(key)
+        if entry is not None and self._cache.is_fresh(entry):
+            self._cache.stats.hits += 1
+            return entry.data
+
+        self._cache.stats.misses += 1
+        headers = entry.validators if entry is not None else None
+        response = await self._request("GET", path, params=params, headers=headers)
+        if response.status == 304 and entry is not None:
+            logger.info("Cached response for {key} is not modified.", key=key)
+            self._cache.touch(key)
+            return entry.data
+        response.raise_for_status()
+        data = await response.json()
+
+        self._cache.put(
+            key,
+            CacheEntry(
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            ),
+        )
+        return data
+
+    async def _stream_json_array(
+        self, path: str, params: Mapping[str, Any] | None = None
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Send a GET request and decode the elements of a JSON array response as they arrive.
+
+        The body is read in chunks of STREAM_CHUNK_SIZE bytes, so elements can be processed
+        while the rest of the response is still downloading. The request is retried like
+        any other until the response starts, but not once elements were yielded. It has no
+        total timeout, only one for reading every chunk, so a slow consumer does not cut
+        it off.
+
+        With a cache, a fresh cached response is used instead of a request and a stale one
+        is revalidated with If-None-Match/If-Modified-Since and reused on 304 Not Modified.
+        The elements of a streamed response are also collected and cached once the whole
+        array has been decoded.
+
+        Args:
+            path (str): The path of the resource.
+            params (Mapping[str, Any] | None, optional): The query parameters.
+
+        Yields:
+            Any: The next decoded element of the array.
+        """
+        key = None
+        entry = None
+        if self._cache is not None:
+            key = self._cache.key(f"{self._base_url}{path}", params)
+            entry = self._cache.get(key)
+            if entry is not None and self._cache.is_fresh(entry):
+                self._cache.stats.hits += 1
+                for item in entry.data:
+                    yield item
+                return
+            self._cache.stats.misses += 1
+
+        headers = entry.validators if entry is not None else None
+        response = await self._request(
+            "GET", path, params=params, headers=headers, stream=True
+        )
+        decoder = JSONArrayDecoder()
+        items: list[Any] = []
+        try:
+            if (
+                response.status == 304
+                and self._cache is not None
+                and key is not None
+                and entry is not None
+            ):
+                logger.info("Cached response for {key} is not modified.", key=key)
+                self._cache.touch(key)
+                for item in entry.data:
+                    yield item
+                return
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                for item in decoder.feed(chunk):
+                    if key is not None:
+                        items.append(item)
+                    yield item
+        finally:
+            self._release_stream(response)
+        decoder.close()
+
+        if self._cache is not None and key is not None:
+            self._cache.put(
+                key,
+                CacheEntry(
+                    items,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
+            )
+
+
+def _stream_timeout() -> ClientTimeout:
+    return ClientTimeout(
+        total=None,
+        sock_connect=settings.HTTP_CONNECT_TIMEOUT,
+        sock_read=settings.HTTP_STREAM_READ_TIMEOUT,
+    )
@@ -0,0 +1,216 @@
+import json
+import time
+import sqlite3
+import dataclasses
+from typing import Any
+from pathlib import Path
+from collections import OrderedDict
+from urllib.parse import urlencode
+from collections.abc import Mapping
+
+from loguru import logger
+
+
+@dataclasses.dataclass(slots=True)
+class CacheEntry:
+    """
+    A cached JSON response.
+
+    Attributes:
+        data (Any): The decoded JSON body.
+        etag (str | None): The ETag header of the response.
+        last_modified (str | None): The Last-Modified header of the response.
+        stored_at (float): The time the response was stored or last revalidated.
+    """
+
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = dataclasses.field(default_factory=time.time)
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers that revalidate this entry."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclasses.dataclass(slots=True)
+class CacheStats:
+    """
+    Response cache counters.
+
+    Attributes:
+        hits (int): Fresh entries returned without a request.
+        misses (int): Lookups that needed a request.
+        revalidations (int): Stale entries confirmed by a 304 Not Modified response.
+        stores (int): Responses stored.
+        evictions (int): Entries evicted to stay within the size limit.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of JSON responses with expiry and an optional on-disk backend.
+
+    Entries younger than ttl are fresh and are returned without a request. Stale entries
+    are kept, so their ETag and Last-Modified can be used to revalidate them.
+
+    Args:
+        ttl (float, optional): Seconds an entry stays fresh. Defaults to 300.
+        max_entries (int, optional): Maximum number of entries. Defaults to 128.
+        path (str | Path | None, optional): SQLite file to persist entries in, so they
+            survive restarts. Defaults to None (memory only).
+
+    Methods:
+        key(url: str, params: Mapping[str, Any] | None = None) -> str: Build a cache key.
+        get(key: str) -> CacheEntry | None: Get an entry, fresh or stale.
+        is_fresh(entry: CacheEntry) -> bool: Check whether an entry is still fresh.
+        put(key: str, entry: CacheEntry) -> None: Store an entry.
+        touch(key: str) -> None: Mark an entry as revalidated.
+        clear() -> None: Remove all entries.
+    """
+
+    def __init__(
+        self, ttl: float = 300, max_entries: int = 128, path: str | Path | None = None
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, data TEXT, etag TEXT, last_modified TEXT, "
+                "stored_at REAL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        """
+        Build a cache key from a URL and query parameters.
+
+        Args:
+            url (str): The request URL.
+            params (Mapping[str, Any] | None, optional): The query parameters.
+
+        Returns:
+            str: The URL with the parameters in sorted order.
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Get an entry, fresh or stale, loading it from disk if needed.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            CacheEntry | None: The entry or None if there is none.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self._db is None:
+            return None
+
+        row = self._db.execute(
+            "SELECT data, etag, last_modified, stored_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(json.loads(row[0]), row[1], row[2], row[3])
+        self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        Check whether an entry is younger than the TTL.
+
+        Args:
+            entry (CacheEntry): The entry to check.
+
+        Returns:
+            bool: True if the entry can be used without revalidation.
+        """
+        return time.time() - entry.stored_at < self.ttl
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key (str): The cache key.
+            entry (CacheEntry): The entry to store.
+        """
+        self.stats.stores += 1
+        self._remember(key, entry)
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(entry.data),
+                    entry.etag,
+                    entry.last_modified,
+                    entry.stored_at,
+                ),
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+    def touch(self, key: str) -> None:
+        """
+        Mark an entry as revalidated, making it fresh again.
+
+        Args:
+            key (str): The cache key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        self.stats.revalidations += 1
+        entry.stored_at = time.time()
+        if self._db is not None:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (entry.stored_at, key)
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk."""
+        self._entries.clear()
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Put an entry in memory, evicting the least recently used ones."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug("Evicted cached response: {key}.", key=evicted)
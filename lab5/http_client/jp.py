@@ -1,9 +1,41 @@
+import asyncio
+from typing import Any, TypeVar
+from collections.abc import Callable, AsyncGenerator
+
 from loguru import logger
-from async_lru import alru_cache
 
-from schemas import PostAddSchema
+from core import settings
+from schemas import UserSchema, CommentSchema, PostAddSchema, ResourcesSchema
 
 from .base import HTTPClient
+from .cache import ResponseCache
+
+T = TypeVar("T")
+
+
+def _post_from_json(post: dict[str, Any]) -> PostAddSchema:
+    return PostAddSchema(user_id=post["userId"], title=post["title"], body=post["body"])
+
+
+def _comment_from_json(comment: dict[str, Any]) -> CommentSchema:
+    return CommentSchema(
+        id=comment["id"],
+        post_id=comment["postId"],
+        name=comment["name"],
+        email=comment["email"],
+        body=comment["body"],
+    )
+
+
+def _user_from_json(user: dict[str, Any]) -> UserSchema:
+    return UserSchema(
+        id=user["id"],
+        name=user["name"],
+        username=user["username"],
+        email=user["email"],
+        phone=user["phone"],
+        website=user["website"],
+    )
 
 
 class JPHTTPClient(HTTPClient):
@@ -12,15 +44,23 @@ class JPHTTPClient(HTTPClient):
 
     Args:
         base_url (str): The base URL of the JSONPlaceholder API.
+        cache (ResponseCache | None, optional): Cache of JSON responses shared between
+            clients. Defaults to None (no caching).
 
     Methods:
         fetch_posts: Fetches posts from the JSONPlaceholder API.
+        stream_posts: Streams posts from the JSONPlaceholder API as they are downloaded.
+        fetch_comments: Fetches comments from the JSONPlaceholder API.
+        fetch_users: Fetches users from the JSONPlaceholder API.
+        fetch_resources: Fetches posts, comments and users concurrently.
+        fetch_post_pages: Fetches pages of posts concurrently.
+        fetch_comment_pages: Fetches pages of comments concurrently.
+        fetch_user_pages: Fetches pages of users concurrently.
     """
 
-    def __init__(self, base_url: str) -> None:
-        super().__init__(base_url)
+    def __init__(self, base_url: str, cache: ResponseCache | None = None) -> None:
+        super().__init__(base_url, cache=cache)
 
-    @alru_cache
     async def fetch_posts(self) -> list[PostAddSchema]:
         """
         Fetches posts from the JSONPlaceholder API.
@@ -28,11 +68,159 @@ class JPHTTPClient(HTTPClient):
         Returns:
             A list of PostAddSchema objects representing the fetched posts.
         """
-        logger.info(f"Fetching posts from {self._session._base_url}/posts.")
-        async with self._session.get("/posts") as response:
-            result = await response.json()
-        logger.info(f"Fetched {len(result)} posts.")
-        return [
-            PostAddSchema(user_id=post["userId"], title=post["title"], body=post["body"])
-            for post in result
+        return await self._fetch("/posts", _post_from_json)
+
+    async def stream_posts(self) -> AsyncGenerator[PostAddSchema, None]:
+        """
+        Streams posts from the JSONPlaceholder API as they are downloaded.
+
+        Unlike fetch_posts, the response is decoded incrementally, so the first posts are
+        available before the download completes and memory use does not depend on the size
+        of the response.
+
+        Yields:
+            PostAddSchema objects representing the fetched posts.
+        """
+        logger.info("Streaming posts from {base_url}/posts.", base_url=self._base_url)
+        count = 0
+        async for post in self._stream_json_array("/posts"):
+            yield _post_from_json(post)
+            count += 1
+        logger.info("Streamed {count} posts.", count=count)
+
+    async def fetch_comments(self) -> list[CommentSchema]:
+        """
+        Fetches comments from the JSONPlaceholder API.
+
+        Returns:
+            A list of CommentSchema objects representing the fetched comments.
+        """
+        return await self._fetch("/comments", _comment_from_json)
+
+    async def fetch_users(self) -> list[UserSchema]:
+        """
+        Fetches users from the JSONPlaceholder API.
+
+        Returns:
+            A list of UserSchema objects representing the fetched users.
+        """
+        return await self._fetch("/users", _user_from_json)
+
+    async def fetch_resources(self) -> ResourcesSchema:
+        """
+        Fetches posts, comments and users from the JSONPlaceholder API concurrently.
+
+        Returns:
+            A ResourcesSchema object with the fetched posts, comments and users.
+        """
+        posts, comments, users = await asyncio.gather(
+            self.fetch_posts(), self.fetch_comments(), self.fetch_users()
+        )
+        return ResourcesSchema(posts=posts, comments=comments, users=users)
+
+    def fetch_post_pages(
+        self, limit: int | None = None
+    ) -> AsyncGenerator[list[PostAddSchema], None]:
+        """
+        Fetches pages of posts from the JSONPlaceholder API concurrently.
+
+        Args:
+            limit (int | None, optional): The number of posts per page.
+                Defaults to settings.HTTP_PAGE_LIMIT.
+
+        Yields:
+            Lists of PostAddSchema objects, one per page, in the order they arrive.
+        """
+        return self._fetch_pages("/posts", _post_from_json, limit)
+
+    def fetch_comment_pages(
+        self, limit: int | None = None
+    ) -> AsyncGenerator[list[CommentSchema], None]:
+        """
+        Fetches pages of comments from the JSONPlaceholder API concurrently.
+
+        Args:
+            limit (int | None, optional): The number of comments per page.
+                Defaults to settings.HTTP_PAGE_LIMIT.
+
+        Yields:
+            Lists of CommentSchema objects, one per page, in the order they arrive.
+        """
+        return self._fetch_pages("/comments", _comment_from_json, limit)
+
+    def fetch_user_pages(
+        self, limit: int | None = None
+    ) -> AsyncGenerator[list[UserSchema], None]:
+        """
+        Fetches pages of users from the JSONPlaceholder API concurrently.
+
+        Args:
+            limit (int | None, optional): The number of users per page.
+                Defaults to settings.HTTP_PAGE_LIMIT.
+
+        Yields:
+            Lists of UserSchema objects, one per page, in the order they arrive.
+        """
+        return self._fetch_pages("/users", _user_from_json, limit)
+
+    async def _fetch(self, path: str, parse: Callable[[dict[str, Any]], T]) -> list[T]:
+        """Fetch a whole resource and parse its items."""
+        logger.info("Fetching {base_url}{path}.", base_url=self._base_url, path=path)
+        result = await self._get_json(path)
+        logger.info("Fetched {count} items from {path}.", count=len(result), path=path)
+        return [parse(item) for item in result]
+
+    async def _fetch_page(
+        self, path: str, parse: Callable[[dict[str, Any]], T], page: int, limit: int
+    ) -> tuple[list[T], int | None]:
+        """Fetch a page of a resource and the total number of items, if reported."""
+        response = await self._request(
+            "GET", path, params={"_page": page, "_limit": limit}
+        )
+        response.raise_for_status()
+        total = response.headers.get("X-Total-Count")
+        items = [parse(item) for item in await response.json()]
+        return items, int(total) if total is not None else None
+
+    async def _fetch_pages(
+        self, path: str, parse: Callable[[dict[str, Any]], T], limit: int | None
+    ) -> AsyncGenerator[list[T], None]:
+        """
+        Fetch all pages of a resource, yielding them as they complete.
+
+        The first page reports the total number of items in the X-Total-Count header, then
+        the remaining pages are requested at once and limited by the client concurrency.
+        Without the header pages are requested one by one until a short page.
+        """
+        limit = settings.HTTP_PAGE_LIMIT if limit is None else limit
+        items, total = await self._fetch_page(path, parse, 1, limit)
+        if items:
+            yield items
+
+        if total is None:
+            page = 1
+            while len(items) == limit:
+                page += 1
+                items, _ = await self._fetch_page(path, parse, page, limit)
+                if items:
+                    yield items
+            return
+
+        pages = -(-total // limit)
+        logger.info(
+            "Fetching {pages} pages of {limit} items from {path}.",
+            pages=pages,
+            limit=limit,
+            path=path,
+        )
+        tasks = [
+            asyncio.ensure_future(self._fetch_page(path, parse, page, limit))
+            for page in range(2, pages + 1)
         ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                items, _ = await task
+                yield items
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,42 @@
+from loguru import logger
+from aiohttp import TCPConnector, ClientSession, ClientTimeout
+
+from core import settings
+
+_session: ClientSession | None = None
+
+
+def get_session() -> ClientSession:
+    """
+    Get the application-wide HTTP session, creating it on first use.
+
+    The session owns a single connection pool, so connections, DNS lookups and TLS
+    handshakes are reused by every client. It must be used from one event loop and
+    closed with close_session when the application exits.
+
+    Returns:
+        ClientSession: The shared session.
+    """
+    global _session
+    if _session is None or _session.closed:
+        logger.info("Creating shared HTTP session.")
+        connector = TCPConnector(
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+        )
+        timeout = ClientTimeout(
+            total=settings.HTTP_TIMEOUT, sock_connect=settings.HTTP_CONNECT_TIMEOUT
+        )
+        _session = ClientSession(connector=connector, timeout=timeout)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the application-wide HTTP session, if it was created."""
+    global _session
+    if _session is not None and not _session.closed:
+        logger.info("Closing shared HTTP session.")
+        await _session.close()
+    _session = None
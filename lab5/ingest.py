@@ -0,0 +1,274 @@
+"""
+Load posts from a local JSON or NDJSON dump into the database without the GUI.
+
+The file is read in chunks and validated in batches, optionally in a pool of worker
+processes, and the valid posts are written with bulk inserts in large transactions.
+Posts may use either the JSONPlaceholder field name userId or user_id.
+
+Set DATABASE_CONNECTION to a database file to keep the loaded posts, e.g.:
+    DATABASE_CONNECTION=sqlite+aiosqlite:///posts.db python ingest.py posts.ndjson
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import dataclasses
+from typing import Any
+from pathlib import Path
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+from loguru import logger
+from pydantic import TypeAdapter, ValidationError
+
+from core import JSONArrayDecoder, setup_logging
+from store import PostRepository, close_db, setup_db
+from schemas import PostAddSchema
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+_posts_adapter = TypeAdapter(list[PostAddSchema])
+
+
+@dataclasses.dataclass(slots=True)
+class IngestStats:
+    """
+    Ingest counters.
+
+    Attributes:
+        read (int): Records read from the file.
+        inserted (int): Posts inserted into the database.
+        invalid (int): Records skipped because they are not valid posts.
+        started (float): The time the ingest started.
+    """
+
+    read: int = 0
+    inserted: int = 0
+    invalid: int = 0
+    started: float = dataclasses.field(default_factory=time.perf_counter)
+
+    @property
+    def rate(self) -> float:
+        """Inserted posts per second so far."""
+        return self.inserted / max(time.perf_counter() - self.started, 1e-9)
+
+
+def detect_format(path: Path) -> str:
+    """Guess whether a file is a JSON array or NDJSON from its extension or content."""
+    if path.suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    with path.open("rb") as file:
+        start = file.read(READ_CHUNK_SIZE).lstrip()
+    return "json" if start.startswith(b"[") else "ndjson"
+
+
+def read_records(path: Path, file_format: str) -> Iterator[Any]:
+    """
+    Read the records of a file one by one without loading it as a whole.
+
+    Lines of an NDJSON file that are not valid JSON are yielded as None.
+    """
+    with path.open("rb") as file:
+        if file_format == "ndjson":
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield None
+            return
+
+        decoder = JSONArrayDecoder()
+        while chunk := file.read(READ_CHUNK_SIZE):
+            yield from decoder.feed(chunk)
+        decoder.close()
+
+
+def read_batches(path: Path, file_format: str, batch_size: int) -> Iterator[list[Any]]:
+    """Group the records of a file into batches."""
+    batch = []
+    for record in read_records(path, file_format):
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _post_fields(record: Any) -> Any:
+    if not isinstance(record, dict):
+        return record
+    return {
+        "user_id": record.get("user_id", record.get("userId")),
+        "title": record.get("title"),
+        "body": record.get("body"),
+    }
+
+
+def validate_batch(records: list[Any]) -> tuple[list[PostAddSchema], int]:
+    """
+    Validate a batch of records as posts.
+
+    The batch is validated at once; only if that fails are the records validated one by
+    one to skip the invalid ones.
+
+    Args:
+        records (list[Any]): The decoded records.
+
+    Returns:
+        tuple[list[PostAddSchema], int]: The valid posts and the number of invalid records.
+    """
+    fields = [_post_fields(record) for record in records]
+    try:
+        return _posts_adapter.validate_python(fields), 0
+    except ValidationError:
+        pass
+
+    posts = []
+    for post_fields in fields:
+        try:
+            posts.append(PostAddSchema.model_validate(post_fields))
+        except ValidationError:
+            continue
+    return posts, len(fields) - len(posts)
+
+
+async def ingest(
+    path: Path,
+    file_format: str,
+    batch_size: int,
+    transaction_size: int,
+    workers: int,
+    progress_interval: float,
+) -> IngestStats:
+    """
+    Load the posts of a file into the database.
+
+    Args:
+        path (Path): The JSON or NDJSON file.
+        file_format (str): "json", "ndjson" or "auto".
+        batch_size (int): Records validated at a time.
+        transaction_size (int): Posts inserted per transaction.
+        workers (int): Worker processes validating batches; 0 validates in this process.
+        progress_interval (float): Seconds between progress reports.
+
+    Returns:
+        IngestStats: The ingest counters.
+    """
+    if file_format == "auto":
+        file_format = detect_format(path)
+    await setup_db()
+
+    stats = IngestStats()
+    pending_posts: list[PostAddSchema] = []
+    last_report = stats.started
+
+    async def write(
+        posts: list[PostAddSchema], invalid: int, flush: bool = False
+    ) -> None:
+        nonlocal last_report
+        stats.invalid += invalid
+        pending_posts.extend(posts)
+        if len(pending_posts) >= transaction_size or (flush and pending_posts):
+            stats.inserted += await PostRepository.bulk_insert(pending_posts)
+            pending_posts.clear()
+        if time.perf_counter() - last_report >= progress_interval:
+            last_report = time.perf_counter()
+            logger.info(
+                "Read {read} records, inserted {inserted} posts ({rate:,.0f} rows/s).",
+                read=stats.read,
+                inserted=stats.inserted,
+                rate=stats.rate,
+            )
+
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(workers) if workers > 0 else None
+    validating: deque[asyncio.Future[tuple[list[PostAddSchema], int]]] = deque()
+    try:
+        for records in read_batches(path, file_format, batch_size):
+            stats.read += len(records)
+            if pool is None:
+                await write(*validate_batch(records))
+                continue
+            # Keep every worker busy while the previous batches are written.
+            validating.append(loop.run_in_executor(pool, validate_batch, records))
+            if len(validating) >= 2 * workers:
+                await write(*await validating.popleft())
+        while validating:
+            await write(*await validating.popleft())
+        await write([], 0, flush=True)
+    finally:
+        for future in validating:
+            future.cancel()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return stats
+
+
+async def main(args: argparse.Namespace) -> int:
+    try:
+        stats = await ingest(
+            args.path,
+            args.format,
+            args.batch_size,
+            args.transaction_size,
+            args.workers,
+            args.progress_interval,
+        )
+    finally:
+        await close_db()
+
+    elapsed = time.perf_counter() - stats.started
+    logger.success(
+        "Inserted {inserted} of {read} records in {elapsed:.1f}s ({rate:,.0f} rows/s), "
+        "skipped {invalid} invalid.",
+        inserted=stats.inserted,
+        read=stats.read,
+        elapsed=elapsed,
+        rate=stats.inserted / max(elapsed, 1e-9),
+        invalid=stats.invalid,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", type=Path, help="JSON or NDJSON file of posts.")
+    parser.add_argument(
+        "--format",
+        choices=("auto", "json", "ndjson"),
+        default="auto",
+        help="File format.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=10_000, help="Records validated at a time."
+    )
+    parser.add_argument(
+        "--transaction-size",
+        type=int,
+        default=100_000,
+        help="Posts inserted per transaction.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes for validation (0 validates in the main process).",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between progress reports.",
+    )
+    args = parser.parse_args()
+    setup_logging()
+    logger.disable("store")
+    exit_code = asyncio.run(main(args))
+    logger.complete()
+    sys.exit(exit_code)
@@ -1,8 +1,24 @@
-import asyncio
+from loguru import logger
 
 import app
-from store import setup_db
+from core import setup_logging
+
+
+async def startup() -> None:
+    """Set up the database once the window is shown, importing the database stack."""
+    from store import setup_db
+
+    await setup_db()
+
+
+async def shutdown() -> None:
+    """Close the database connections."""
+    from store import close_db
+
+    await close_db()
+
 
 if __name__ == "__main__":
-    asyncio.run(setup_db())
-    app.run()
+    setup_logging()
+    app.run(on_startup=startup, on_shutdown=shutdown)
+    logger.complete()
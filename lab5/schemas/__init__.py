@@ -1,3 +1,12 @@
 from .post import PostSchema, PostAddSchema
+from .user import UserSchema
+from .comment import CommentSchema
+from .resources import ResourcesSchema
 
-__all__ = ["PostSchema", "PostAddSchema"]
+__all__ = [
+    "PostSchema",
+    "PostAddSchema",
+    "CommentSchema",
+    "UserSchema",
+    "ResourcesSchema",
+]
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class CommentSchema(BaseModel):
+    """
+    Schema for a comment to a post.
+
+    Attributes:
+        id (int): The ID of the comment.
+        post_id (int): The ID of the commented post.
+        name (str): The name of the comment.
+        email (str): The email of the comment author.
+        body (str): The content of the comment.
+    """
+
+    id: int
+    post_id: int
+    name: str
+    email: str
+    body: str
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+from .post import PostAddSchema
+from .user import UserSchema
+from .comment import CommentSchema
+
+
+class ResourcesSchema(BaseModel):
+    """
+    Schema for posts fetched together with their related resources.
+
+    Attributes:
+        posts (list[PostAddSchema]): The posts.
+        comments (list[CommentSchema]): The comments to the posts.
+        users (list[UserSchema]): The authors of the posts.
+    """
+
+    posts: list[PostAddSchema]
+    comments: list[CommentSchema]
+    users: list[UserSchema]
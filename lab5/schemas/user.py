@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class UserSchema(BaseModel):
+    """
+    Schema for a user.
+
+    Attributes:
+        id (int): The ID of the user.
+        name (str): The full name of the user.
+        username (str): The username of the user.
+        email (str): The email of the user.
+        phone (str): The phone number of the user.
+        website (str): The website of the user.
+    """
+
+    id: int
+    name: str
+    username: str
+    email: str
+    phone: str
+    website: str
+
+    model_config = ConfigDict(from_attributes=True)
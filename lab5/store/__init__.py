@@ -1,4 +1,5 @@
-from .database import setup_db
+from .database import close_db
+from .migrations import setup_db
 from .post_repository import PostRepository
 
-__all__ = ["setup_db", "PostRepository"]
+__all__ = ["setup_db", "close_db", "PostRepository"]
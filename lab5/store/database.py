@@ -1,35 +1,67 @@
+from typing import TYPE_CHECKING, Any
+
 from loguru import logger
+from sqlalchemy import event
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from core import settings
 
-engine = create_async_engine(settings.DATABASE_CONNECTION)
+if TYPE_CHECKING:
+    from .profiler import QueryProfiler
+
+IN_MEMORY = make_url(settings.DATABASE_CONNECTION).database in (None, "", ":memory:")
+
+_pool_options: dict[str, Any] = (
+    {}
+    if IN_MEMORY
+    else {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+    }
+)
+
+engine = create_async_engine(settings.DATABASE_CONNECTION, **_pool_options)
 session_maker = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
 
 
-class Model(DeclarativeBase):
-    """Base class for database models."""
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection: Any, _: Any) -> None:
+    """Apply the configured pragmas to every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA cache_size = {int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute(f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA temp_store = {settings.SQLITE_TEMP_STORE}")
+    cursor.execute(f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT)}")
+    cursor.close()
 
-    pass
 
+query_profiler: "QueryProfiler | None" = None
+if settings.DATABASE_PROFILE:
+    # The profiler imports greenlet directly, which is only installed as a dependency
+    # of SQLAlchemy's asyncio extra, so it is only imported when profiling is enabled.
+    from .profiler import QueryProfiler
 
-async def _create_table() -> None:
-    """Create database tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Model.metadata.create_all)
-    logger.warning("Database successfully created")
+    query_profiler = QueryProfiler(settings.DATABASE_SLOW_QUERY_MS / 1000)
+    query_profiler.attach(engine)
 
 
-async def _drop_table() -> None:
-    """Drop database tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Model.metadata.drop_all)
-    logger.warning("Database successfully dropped")
+class Model(DeclarativeBase):
+    """Base class for database models."""
+
+    pass
 
 
-async def setup_db() -> None:
-    """Setup database tables."""
-    await _drop_table()
-    await _create_table()
-    logger.info("Database successfully setup")
+async def close_db() -> None:
+    """Close all database connections and report the query profile, if enabled."""
+    if query_profiler is not None:
+        query_profiler.dump(settings.DATABASE_PROFILE_REPORT)
+    await engine.dispose()
+    logger.info("Database connections closed")
@@ -0,0 +1,86 @@
+from collections.abc import Callable
+
+from loguru import logger
+from sqlalchemy import Connection, text
+
+from .models import POSTS_FTS_DDL
+from .database import IN_MEMORY, Model, engine
+
+
+def _create_posts(connection: Connection) -> None:
+    """Create the posts table."""
+    # Plain DDL rather than create_all, so the migration does not change with PostORM.
+    # IF NOT EXISTS keeps databases created before schema versioning working.
+    connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                title VARCHAR NOT NULL,
+                body VARCHAR NOT NULL,
+                PRIMARY KEY (id)
+            )
+            """
+        )
+    )
+    connection.execute(text("CREATE INDEX IF NOT EXISTS ix_posts_id ON posts (id)"))
+
+
+def _index_posts(connection: Connection) -> None:
+    """Create the full-text index of posts and fill it with the existing posts."""
+    for statement in POSTS_FTS_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')"))
+
+
+# Migrations of a file database, in order. The schema version of a database is the
+# number of migrations applied to it and is stored in PRAGMA user_version. Append new
+# migrations to the end and never change the ones that were released.
+MIGRATIONS: tuple[Callable[[Connection], None], ...] = (
+    _create_posts,
+    _index_posts,
+)
+
+
+def _migrate(connection: Connection) -> None:
+    """Apply the migrations the database has not seen yet."""
+    version = connection.exec_driver_sql("PRAGMA user_version").scalar_one()
+    if version > len(MIGRATIONS):
+        raise RuntimeError(
+            f"Database schema version {version} is newer than {len(MIGRATIONS)}"
+        )
+    for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        logger.info(f"Applying database migration {number}: {migration.__doc__}")
+        migration(connection)
+    connection.exec_driver_sql(f"PRAGMA user_version = {len(MIGRATIONS)}")
+
+
+async def _create_table() -> None:
+    """Create database tables."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Model.metadata.create_all)
+    logger.warning("Database successfully created")
+
+
+async def _drop_table() -> None:
+    """Drop database tables."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Model.metadata.drop_all)
+    logger.warning("Database successfully dropped")
+
+
+async def setup_db() -> None:
+    """
+    Setup database tables.
+
+    An in-memory database is recreated from scratch. A file database is created if it is
+    missing and migrated to the latest schema version, keeping its data.
+    """
+    if IN_MEMORY:
+        await _drop_table()
+        await _create_table()
+    else:
+        async with engine.begin() as conn:
+            await conn.run_sync(_migrate)
+    logger.info("Database successfully setup")
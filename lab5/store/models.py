@@ -1,3 +1,4 @@
+from sqlalchemy import DDL, event, table, column
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Model
@@ -20,3 +21,41 @@ class PostORM(Model):
     user_id: Mapped[int]
     title: Mapped[str]
     body: Mapped[str]
+
+
+# FTS5 index over the title and body of posts. The trigram tokenizer makes MATCH do
+# case-insensitive substring search. It is an external content table, so the text is
+# not stored twice, and it is kept in sync with "posts" by triggers.
+posts_fts = table(
+    "posts_fts", column("rowid"), column("title"), column("body"), column("rank")
+)
+
+POSTS_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, body, content='posts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO posts_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+)
+
+for statement in POSTS_FTS_DDL:
+    event.listen(PostORM.__table__, "after_create", DDL(statement))
+event.listen(PostORM.__table__, "before_drop", DDL("DROP TABLE IF EXISTS posts_fts"))
@@ -0,0 +1,114 @@
+import dataclasses
+from collections import OrderedDict
+
+from loguru import logger
+
+from schemas import PostSchema
+
+
+@dataclasses.dataclass(slots=True)
+class PostCacheStats:
+    """
+    Post cache counters.
+
+    Attributes:
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that needed a query.
+        stores (int): Posts stored.
+        invalidations (int): Posts removed because they were updated or deleted.
+        evictions (int): Posts evicted to stay within the size limit.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PostCache:
+    """
+    Size-bounded LRU identity map of posts keyed by id.
+
+    The cached posts are shared between callers and must not be modified in place.
+    Every invalidation bumps the generation, so a post read before a concurrent update
+    or delete is not stored over the newer state.
+
+    Args:
+        max_entries (int, optional): Maximum number of posts. Defaults to 1024.
+
+    Methods:
+        get(post_id: int) -> PostSchema | None: Get a cached post.
+        put(post: PostSchema, generation: int | None = None) -> None: Store a post.
+        invalidate(post_id: int) -> None: Remove a post.
+        clear() -> None: Remove all posts.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self.stats = PostCacheStats()
+        self.generation = 0
+        self._posts: OrderedDict[int, PostSchema] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def get(self, post_id: int) -> PostSchema | None:
+        """
+        Get a cached post.
+
+        Args:
+            post_id (int): The id of the post.
+
+        Returns:
+            PostSchema | None: The post or None if it is not cached.
+        """
+        post = self._posts.get(post_id)
+        if post is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._posts.move_to_end(post_id)
+        return post
+
+    def put(self, post: PostSchema, generation: int | None = None) -> None:
+        """
+        Store a post, evicting the least recently used ones.
+
+        Args:
+            post (PostSchema): The post to store.
+            generation (int | None, optional): The generation the post was read at. The
+                post is not stored if anything was invalidated since. Defaults to None
+                (always store).
+        """
+        if generation is not None and generation != self.generation:
+            return
+        self.stats.stores += 1
+        self._posts[post.id] = post
+        self._posts.move_to_end(post.id)
+        while len(self._posts) > self.max_entries:
+            evicted, _ = self._posts.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug("Evicted cached post with id: {post_id}.", post_id=evicted)
+
+    def invalidate(self, post_id: int) -> None:
+        """
+        Remove a post.
+
+        Args:
+            post_id (int): The id of the post.
+        """
+        self.generation += 1
+        if self._posts.pop(post_id, None) is not None:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all posts."""
+        self.generation += 1
+        self._posts.clear()
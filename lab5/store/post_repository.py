@@ -1,27 +1,80 @@
+from collections.abc import Iterable, Sequence, AsyncGenerator
+
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import Select, delete, insert, select, update, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from core import LogSampler
 from schemas import PostSchema, PostAddSchema
 
-from .models import PostORM
+from .models import PostORM, posts_fts
 from .database import session_maker
+from .post_cache import PostCache, PostCacheStats
+from .write_batcher import T, Operation, WriteBatcher, WriteBatchStats
+
+TRIGRAM_LENGTH = 3
+# Bound parameters per statement, below the SQLite default limit of 999 in older builds.
+MAX_SQL_PARAMETERS = 900
+
+
+def _fts_phrase(text: str) -> str:
+    """Quote text as an FTS5 phrase, so it is matched literally."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+# Messages logged once per added or found post are sampled, so bulk loads do not
+# flood the log.
+_row_log_sample = LogSampler()
+
+_POST_COLUMNS = (PostORM.id, PostORM.user_id, PostORM.title, PostORM.body)
+_POST_FIELDS = frozenset(PostSchema.model_fields)
+
+
+def _chunks(items: Sequence[int], size: int) -> Iterable[Sequence[int]]:
+    """Split items into consecutive chunks of at most size items."""
+    return (items[start : start + size] for start in range(0, len(items), size))
+
+
+def _construct_post(id: int, user_id: int, title: str, body: str) -> PostSchema:
+    """Build a post from a trusted database row without validation."""
+    return PostSchema.model_construct(
+        set(_POST_FIELDS), id=id, user_id=user_id, title=title, body=body
+    )
 
 
 class PostRepository:
     """
     Repository for Post ORM model.
 
+    Database errors are not caught and propagate to the caller.
+
     Methods:
         add_one(cls, post: PostAddSchema) -> PostSchema: Add a post to the database.
         add_many(cls, posts: list[PostAddSchema]) -> list[PostSchema]: Add multiple posts to the database.
+        bulk_insert(cls, posts: Sequence[PostAddSchema]) -> int: Insert many posts without returning them.
         find_all(cls, skip: int = 0, limit: int = 100) -> list[PostSchema]: Find all posts in the database.
+        find_page(cls, after_id: int | None = None, limit: int = 100) -> list[PostSchema]: Find a page of posts after an id.
+        stream_all(cls, batch_size: int = 1000) -> AsyncGenerator[PostSchema, None]: Stream all posts in the database.
+        stream_batches(cls, batch_size: int = 1000, user_id: int | None = None, title: str | None = None) -> AsyncGenerator[list[PostSchema], None]: Stream filtered posts in batches.
         find_one(cls, post_id: int) -> PostSchema | None: Find a post in the database by id.
+        find_by_title(cls, title: str) -> list[PostSchema]: Find posts in the database by title.
+        search(cls, text: str, limit: int = 20) -> list[PostSchema]: Search posts by title or body.
         update_one(cls, post: PostSchema) -> PostSchema | None: Update a post in the database by id.
+        update_many(cls, posts: list[PostSchema]) -> list[int]: Update multiple posts in the database by id.
         delete_one(cls, post_id: int) -> bool: Delete a post in the database by id.
+        delete_many(cls, post_ids: list[int]) -> list[int]: Delete multiple posts in the database by id.
+        enable_write_batching(cls, max_batch_size: int = 100, max_delay: float = 0.005) -> None: Share commits between concurrent writes.
+        disable_write_batching(cls) -> None: Commit a transaction per write again.
+        write_batch_stats(cls) -> WriteBatchStats | None: Get the write batching counters.
+        enable_read_cache(cls, max_entries: int = 1024) -> None: Cache posts found by id.
+        disable_read_cache(cls) -> None: Stop caching posts found by id.
+        read_cache_stats(cls) -> PostCacheStats | None: Get the read cache counters.
     """
 
+    _write_batcher: WriteBatcher | None = None
+    _post_cache: PostCache | None = None
+
     @classmethod
-    @logger.catch
     async def add_one(cls, post: PostAddSchema) -> PostSchema:
         """
         Add a post to the database.
@@ -32,16 +85,14 @@ class PostRepository:
         Returns:
             PostSchema: The added post.
         """
-        logger.info(f"Adding post: {post}.")
-        post_orm = PostORM(**post.model_dump())
-        async with session_maker() as session:
-            session.add(post_orm)
-            await session.flush()
-            await session.commit()
-        return PostSchema.model_validate(post_orm)
+        if _row_log_sample():
+            logger.debug("Adding post by user {user_id}.", user_id=post.user_id)
+        added_post = await cls._write(lambda session: cls._add_post(session, post))
+        if cls._post_cache is not None:
+            cls._post_cache.put(added_post)
+        return added_post
 
     @classmethod
-    @logger.catch
     async def add_many(cls, posts: list[PostAddSchema]) -> list[PostSchema]:
         """
         Add multiple posts to the database.
@@ -52,16 +103,46 @@ class PostRepository:
         Returns:
             list[PostSchema]: The added posts.
         """
-        logger.info(f"Adding {len(posts)} posts.")
+        logger.info("Adding {count} posts.", count=len(posts))
         posts_orm = [PostORM(**post.model_dump()) for post in posts]
         async with session_maker() as session:
             session.add_all(posts_orm)
             await session.flush()
             await session.commit()
-        return [PostSchema.model_validate(post_orm) for post_orm in posts_orm]
+        added_posts = [PostSchema.model_validate(post_orm) for post_orm in posts_orm]
+        if cls._post_cache is not None:
+            for added_post in added_posts:
+                cls._post_cache.put(added_post)
+        return added_posts
+
+    @classmethod
+    async def bulk_insert(cls, posts: Sequence[PostAddSchema]) -> int:
+        """
+        Insert many posts in one transaction without returning them.
+
+        Unlike add_many, the posts are inserted with a single executemany INSERT and no
+        ORM objects or generated ids, which makes it the fastest way to load large
+        datasets.
+
+        Args:
+            posts (Sequence[PostAddSchema]): The posts to insert.
+
+        Returns:
+            int: The number of inserted posts.
+        """
+        logger.debug("Inserting {count} posts.", count=len(posts))
+        if not posts:
+            return 0
+        rows = [
+            {"user_id": post.user_id, "title": post.title, "body": post.body}
+            for post in posts
+        ]
+        async with session_maker() as session:
+            await session.execute(insert(PostORM), rows)
+            await session.commit()
+        return len(rows)
 
     @classmethod
-    @logger.catch
     async def lazy_add(cls, posts: PostAddSchema) -> PostSchema:
         """
         Add a post to the database if it doesn't exist.
@@ -86,77 +167,280 @@ class PostRepository:
             session.add(post_orm)
             await session.flush()
             await session.commit()
-        return PostSchema.model_validate(post_orm)
+        added_post = PostSchema.model_validate(post_orm)
+        if cls._post_cache is not None:
+            cls._post_cache.put(added_post)
+        return added_post
+
+    @staticmethod
+    async def _find(query: Select[tuple[PostORM]], validate: bool) -> list[PostSchema]:
+        """
+        Execute a query of posts and build schemas from the result.
+
+        Args:
+            query (Select[tuple[PostORM]]): The query selecting PostORM entities.
+            validate (bool): Whether to validate ORM objects or trust plain rows.
+
+        Returns:
+            list[PostSchema]: The found posts.
+        """
+        if validate:
+            async with session_maker() as session:
+                post_orms = (await session.execute(query)).scalars().all()
+            return [PostSchema.model_validate(post_orm) for post_orm in post_orms]
+
+        async with session_maker() as session:
+            rows = (await session.execute(query.with_only_columns(*_POST_COLUMNS))).all()
+        return [_construct_post(*row) for row in rows]
 
     @classmethod
-    @logger.catch
-    async def find_all(cls, skip: int = 0, limit: int = -1) -> list[PostSchema]:
+    async def find_all(
+        cls, skip: int = 0, limit: int = -1, validate: bool = True
+    ) -> list[PostSchema]:
         """
         Find all posts in the database.
 
         Args:
             skip (int, optional): The number of posts to skip. Defaults to 0.
             limit (int, optional): The maximum number of posts to return. Defaults to -1 (all posts).
+            validate (bool, optional): Whether to build the posts from ORM objects with full
+                validation. If False, plain rows are selected and trusted. Defaults to True.
 
         Returns:
             list[PostSchema]: The found posts.
         """
         if limit == -1 and skip == 0:
-            logger.info(f"Finding all posts.")
+            logger.info("Finding all posts.")
             query = select(PostORM)
         elif limit == -1:
-            logger.info(f"Finding all posts from {skip}.")
+            logger.info("Finding all posts from {skip}.", skip=skip)
             query = select(PostORM).offset(skip)
         elif skip == 0:
-            logger.info(f"Finding all posts with a limit of {limit}.")
+            logger.info("Finding all posts with a limit of {limit}.", limit=limit)
             query = select(PostORM).limit(limit)
         else:
-            logger.info(f"Finding all posts from {skip} to {limit}.")
+            logger.info(
+                "Finding all posts from {skip} to {limit}.", skip=skip, limit=limit
+            )
             query = select(PostORM).offset(skip).limit(limit)
+        return await cls._find(query, validate)
+
+    @classmethod
+    async def find_page(
+        cls, after_id: int | None = None, limit: int = 100, validate: bool = True
+    ) -> list[PostSchema]:
+        """
+        Find a page of posts ordered by id using keyset pagination.
+
+        Unlike find_all with skip, the cost of a page does not depend on how far it is
+        from the start, since SQLite seeks directly to after_id in the primary key index.
+
+        Args:
+            after_id (int | None, optional): The id of the last post of the previous page.
+                Defaults to None (the first page).
+            limit (int, optional): The maximum number of posts to return. Defaults to 100.
+            validate (bool, optional): Whether to build the posts from ORM objects with full
+                validation. If False, plain rows are selected and trusted. Defaults to True.
+
+        Returns:
+            list[PostSchema]: The found posts. Pass the id of the last one as after_id to
+                get the next page; an empty list means there are no more posts.
+        """
+        logger.debug(
+            "Finding {limit} posts after id: {after_id}.", limit=limit, after_id=after_id
+        )
+        query = select(PostORM).order_by(PostORM.id).limit(limit)
+        if after_id is not None:
+            query = query.where(PostORM.id > after_id)
+        return await cls._find(query, validate)
+
+    @classmethod
+    async def stream_all(
+        cls, batch_size: int = 1000, validate: bool = True
+    ) -> AsyncGenerator[PostSchema, None]:
+        """
+        Stream all posts in the database ordered by id.
+
+        Rows are fetched from the cursor batch_size at a time and the session only keeps
+        weak references to them, so memory use does not grow with the number of posts.
+
+        Args:
+            batch_size (int, optional): The number of rows to fetch at a time. Defaults to 1000.
+            validate (bool, optional): Whether to build the posts from ORM objects with full
+                validation. If False, plain rows are selected and trusted. Defaults to True.
+
+        Yields:
+            PostSchema: The next post.
+        """
+        logger.info(
+            "Streaming all posts in batches of {batch_size}.", batch_size=batch_size
+        )
+        query = (
+            select(PostORM).order_by(PostORM.id).execution_options(yield_per=batch_size)
+        )
+        async with session_maker() as session:
+            if validate:
+                post_orms_result = await session.stream_scalars(query)
+                async for post_orms in post_orms_result.partitions():
+                    for post_orm in post_orms:
+                        yield PostSchema.model_validate(post_orm)
+                return
+
+            rows_result = await session.stream(query.with_only_columns(*_POST_COLUMNS))
+            async for rows in rows_result.partitions():
+                for row in rows:
+                    yield _construct_post(*row)
+
+    @classmethod
+    async def stream_batches(
+        cls,
+        batch_size: int = 1000,
+        user_id: int | None = None,
+        title: str | None = None,
+        validate: bool = False,
+    ) -> AsyncGenerator[list[PostSchema], None]:
+        """
+        Stream posts in the database ordered by id in batches, optionally filtered.
+
+        Only one batch of rows is held at a time, so memory use does not depend on the
+        number of posts. Rows are trusted by default, since they are read for bulk
+        processing such as exports.
+
+        Args:
+            batch_size (int, optional): The number of posts per batch. Defaults to 1000.
+            user_id (int | None, optional): Only stream posts of this user.
+                Defaults to None (all users).
+            title (str | None, optional): Only stream posts with this substring in the
+                title. Defaults to None (all titles).
+            validate (bool, optional): Whether to build the posts from ORM objects with full
+                validation. Defaults to False.
+
+        Yields:
+            list[PostSchema]: The next batch of posts.
+        """
+        logger.info(
+            "Streaming posts in batches of {batch_size}.",
+            batch_size=batch_size,
+            user_id=user_id,
+            title=title,
+        )
+        query = select(PostORM)
+        if user_id is not None:
+            query = query.where(PostORM.user_id == user_id)
+        if title:
+            query = cls._where_title(query, title)
+        query = query.order_by(PostORM.id).execution_options(yield_per=batch_size)
+
         async with session_maker() as session:
-            post_orms = (await session.execute(query)).scalars().all()
-        return [PostSchema.model_validate(post_orm) for post_orm in post_orms]
+            if validate:
+                post_orms_result = await session.stream_scalars(query)
+                async for post_orms in post_orms_result.partitions():
+                    yield [PostSchema.model_validate(post_orm) for post_orm in post_orms]
+                return
+
+            rows_result = await session.stream(query.with_only_columns(*_POST_COLUMNS))
+            async for rows in rows_result.partitions():
+                yield [_construct_post(*row) for row in rows]
 
     @classmethod
-    @logger.catch
     async def find_one(cls, post_id: int) -> PostSchema | None:
         """
         Find a post in the database by id.
 
+        If the read cache is enabled, cached posts are returned without a query.
+
         Args:
             post_id (int): The id of the post to find.
 
         Returns:
             PostSchema: The found post.
         """
-        logger.info(f"Finding post with id: {post_id}.")
+        # The cache may be enabled, disabled or replaced while the query runs, so the
+        # post is only stored in the cache its generation was read from.
+        cache = cls._post_cache
+        if cache is not None:
+            post = cache.get(post_id)
+            if post is not None:
+                return post
+            generation = cache.generation
+
+        if _row_log_sample():
+            logger.debug("Finding post with id: {post_id}.", post_id=post_id)
         async with session_maker() as session:
             post_orm = await session.get(PostORM, post_id)
 
         if post_orm is None:
             return None
-        return PostSchema.model_validate(post_orm)
+        post = PostSchema.model_validate(post_orm)
+        if cache is not None:
+            cache.put(post, generation)
+        return post
 
     @classmethod
-    @logger.catch
-    async def find_by_title(cls, title: str) -> list[PostSchema]:
+    async def find_by_title(cls, title: str, validate: bool = True) -> list[PostSchema]:
         """
         Find posts in the database by title.
 
+        Titles are looked up in the trigram full-text index. Search strings shorter than a
+        trigram cannot use the index and fall back to a LIKE scan.
+
         Args:
-            title (str): The title of the posts to find.
+            title (str): The substring of the title of the posts to find.
+            validate (bool, optional): Whether to build the posts from ORM objects with full
+                validation. If False, plain rows are selected and trusted. Defaults to True.
 
         Returns:
-            list[PostSchema]: The found posts.
+            list[PostSchema]: The found posts ordered by id.
         """
-        logger.info(f"Finding posts with title: {title}.")
-        query = select(PostORM).where(PostORM.title.like(f"%{title}%"))
-        async with session_maker() as session:
-            post_orms = (await session.execute(query)).scalars().all()
-        return [PostSchema.model_validate(post_orm) for post_orm in post_orms]
+        logger.info("Finding posts with title: {title!r}.", title=title)
+        query = cls._where_title(select(PostORM), title).order_by(PostORM.id)
+        return await cls._find(query, validate)
+
+    @staticmethod
+    def _where_title(query: Select[tuple[PostORM]], title: str) -> Select[tuple[PostORM]]:
+        """Filter a query of posts by a substring of the title."""
+        if len(title) < TRIGRAM_LENGTH:
+            return query.where(PostORM.title.like(f"%{title}%"))
+        return query.join(posts_fts, posts_fts.c.rowid == PostORM.id).where(
+            posts_fts.c.title.op("MATCH")(_fts_phrase(title))
+        )
+
+    @classmethod
+    async def search(
+        cls, text: str, limit: int = 20, validate: bool = True
+    ) -> list[PostSchema]:
+        """
+        Search posts by a substring of their title or body.
+
+        Args:
+            text (str): The text to search for.
+            limit (int, optional): The maximum number of posts to return. Defaults to 20.
+            validate (bool, optional): Whether to build the posts from ORM objects with full
+                validation. If False, plain rows are selected and trusted. Defaults to True.
+
+        Returns:
+            list[PostSchema]: The found posts, best matches first. Search strings shorter
+                than a trigram are matched with a LIKE scan and ordered by id.
+        """
+        logger.info("Searching {limit} posts for: {text!r}.", limit=limit, text=text)
+        if len(text) < TRIGRAM_LENGTH:
+            query = (
+                select(PostORM)
+                .where(PostORM.title.like(f"%{text}%") | PostORM.body.like(f"%{text}%"))
+                .order_by(PostORM.id)
+                .limit(limit)
+            )
+        else:
+            query = (
+                select(PostORM)
+                .join(posts_fts, posts_fts.c.rowid == PostORM.id)
+                .where(literal_column("posts_fts").op("MATCH")(_fts_phrase(text)))
+                .order_by(posts_fts.c.rank)
+                .limit(limit)
+            )
+        return await cls._find(query, validate)
 
     @classmethod
-    @logger.catch
     async def update_one(cls, post: PostSchema) -> PostSchema | None:
         """
         Update a post in the database by id.
@@ -167,24 +451,44 @@ class PostRepository:
         Returns:
             PostSchema: The updated post.
         """
-        logger.info(f"Updating post with id: {post.id}.")
-        async with session_maker() as session:
-            post_orm = await session.get(PostORM, post.id)
-            if post_orm is None:
-                logger.info(f"Post with id: {post.id} not found.")
-                return None
-
-            post_orm.user_id = post.user_id
-            post_orm.title = post.title
-            post_orm.body = post.body
-            await session.flush()
-            await session.commit()
+        logger.debug("Updating post with id: {post_id}.", post_id=post.id)
+        cls._invalidate_cached(post.id)
+        updated_post = await cls._write(lambda session: cls._update_post(session, post))
+        cls._invalidate_cached(post.id)
+        if updated_post is not None:
+            if cls._post_cache is not None:
+                cls._post_cache.put(updated_post)
+            logger.success("Post with id: {post_id} updated.", post_id=post.id)
+        return updated_post
 
-        logger.success(f"Post with id: {post.id} updated.")
-        return PostSchema.model_validate(post_orm)
+    @classmethod
+    async def update_many(cls, posts: list[PostSchema]) -> list[int]:
+        """
+        Update multiple posts in the database by id in one transaction.
+
+        Existing posts are updated with a single executemany UPDATE ... WHERE id = :id
+        instead of loading every post into the session.
+
+        Args:
+            posts (list[PostSchema]): The posts with updated fields. If an id occurs more
+                than once, the last post with it wins.
+
+        Returns:
+            list[int]: The ids of the updated posts. Ids of missing posts are left out.
+        """
+        logger.info("Updating {count} posts.", count=len(posts))
+        posts_by_id = {post.id: post for post in posts}
+        for post_id in posts_by_id:
+            cls._invalidate_cached(post_id)
+        updated_ids = await cls._write(
+            lambda session: cls._update_posts(session, posts_by_id)
+        )
+        for post_id in posts_by_id:
+            cls._invalidate_cached(post_id)
+        logger.success("{count} posts updated.", count=len(updated_ids))
+        return updated_ids
 
     @classmethod
-    @logger.catch
     async def delete_one(cls, post_id: int) -> bool:
         """
         Delete a post in the database by id.
@@ -195,16 +499,183 @@ class PostRepository:
         Returns:
             bool: True if the post was deleted, False otherwise.
         """
-        logger.info(f"Deleting post with id: {post_id}.")
-        async with session_maker() as session:
-            post_orm = await session.get(PostORM, post_id)
-            if post_orm is None:
-                logger.info(f"Post with id: {post_id} not found.")
-                return False
+        logger.debug("Deleting post with id: {post_id}.", post_id=post_id)
+        cls._invalidate_cached(post_id)
+        deleted = await cls._write(lambda session: cls._delete_post(session, post_id))
+        cls._invalidate_cached(post_id)
+        if deleted:
+            logger.success("Post with id: {post_id} deleted.", post_id=post_id)
+        return deleted
 
-            await session.delete(post_orm)
-            await session.flush()
+    @classmethod
+    async def delete_many(cls, post_ids: list[int]) -> list[int]:
+        """
+        Delete multiple posts in the database by id in one transaction.
+
+        Posts are deleted with DELETE ... WHERE id IN (...) statements of at most
+        MAX_SQL_PARAMETERS ids each.
+
+        Args:
+            post_ids (list[int]): The ids of the posts to delete.
+
+        Returns:
+            list[int]: The ids of the deleted posts. Ids of missing posts are left out.
+        """
+        logger.info("Deleting {count} posts.", count=len(post_ids))
+        unique_ids = list(dict.fromkeys(post_ids))
+        for post_id in unique_ids:
+            cls._invalidate_cached(post_id)
+        deleted_ids = await cls._write(
+            lambda session: cls._delete_posts(session, unique_ids)
+        )
+        for post_id in unique_ids:
+            cls._invalidate_cached(post_id)
+        logger.success("{count} posts deleted.", count=len(deleted_ids))
+        return deleted_ids
+
+    @classmethod
+    def enable_write_batching(
+        cls, max_batch_size: int = 100, max_delay: float = 0.005
+    ) -> None:
+        """
+        Commit concurrent add_one, update_one and delete_one calls in shared transactions.
+
+        Args:
+            max_batch_size (int, optional): Maximum number of writes in a transaction.
+                Defaults to 100.
+            max_delay (float, optional): Seconds to wait for more writes before committing.
+                Defaults to 0.005.
+        """
+        cls._write_batcher = WriteBatcher(max_batch_size, max_delay)
+
+    @classmethod
+    async def disable_write_batching(cls) -> None:
+        """Commit pending batched writes and go back to a transaction per write."""
+        write_batcher, cls._write_batcher = cls._write_batcher, None
+        if write_batcher is not None:
+            await write_batcher.flush()
+
+    @classmethod
+    def write_batch_stats(cls) -> WriteBatchStats | None:
+        """
+        Get the write batching counters.
+
+        Returns:
+            WriteBatchStats | None: The counters or None if write batching is disabled.
+        """
+        return cls._write_batcher.stats if cls._write_batcher is not None else None
+
+    @classmethod
+    def enable_read_cache(cls, max_entries: int = 1024) -> None:
+        """
+        Cache posts found by id, so repeated find_one calls skip the database.
+
+        Posts are also cached when they are added or updated and removed when they are
+        updated or deleted. The cache only sees writes made through this repository.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached posts. Defaults to 1024.
+        """
+        cls._post_cache = PostCache(max_entries)
+
+    @classmethod
+    def disable_read_cache(cls) -> None:
+        """Stop caching posts found by id and drop the cached posts."""
+        cls._post_cache = None
+
+    @classmethod
+    def read_cache_stats(cls) -> PostCacheStats | None:
+        """
+        Get the read cache counters.
+
+        Returns:
+            PostCacheStats | None: The counters or None if the read cache is disabled.
+        """
+        return cls._post_cache.stats if cls._post_cache is not None else None
+
+    @classmethod
+    def _invalidate_cached(cls, post_id: int) -> None:
+        """
+        Remove a post from the read cache.
+
+        Writes call it both before and after the commit, so reads that overlap the write
+        cannot put the old state back.
+        """
+        if cls._post_cache is not None:
+            cls._post_cache.invalidate(post_id)
+
+    @classmethod
+    async def _write(cls, operation: Operation[T]) -> T:
+        """Run a write operation in its own transaction or in the next write batch."""
+        if cls._write_batcher is not None:
+            return await cls._write_batcher.submit(operation)
+        async with session_maker() as session:
+            result = await operation(session)
             await session.commit()
+        return result
+
+    @staticmethod
+    async def _add_post(session: AsyncSession, post: PostAddSchema) -> PostSchema:
+        post_orm = PostORM(**post.model_dump())
+        session.add(post_orm)
+        await session.flush()
+        return PostSchema.model_validate(post_orm)
+
+    @staticmethod
+    async def _update_post(session: AsyncSession, post: PostSchema) -> PostSchema | None:
+        post_orm = await session.get(PostORM, post.id)
+        if post_orm is None:
+            logger.info("Post with id: {post_id} not found.", post_id=post.id)
+            return None
+
+        post_orm.user_id = post.user_id
+        post_orm.title = post.title
+        post_orm.body = post.body
+        await session.flush()
+        return PostSchema.model_validate(post_orm)
+
+    @staticmethod
+    async def _delete_post(session: AsyncSession, post_id: int) -> bool:
+        post_orm = await session.get(PostORM, post_id)
+        if post_orm is None:
+            logger.info("Post with id: {post_id} not found.", post_id=post_id)
+            return False
 
-        logger.success(f"Post with id: {post_id} deleted.")
+        await session.delete(post_orm)
+        await session.flush()
         return True
+
+    @staticmethod
+    async def _update_posts(
+        session: AsyncSession, posts_by_id: dict[int, PostSchema]
+    ) -> list[int]:
+        existing_ids: set[int] = set()
+        for chunk in _chunks(list(posts_by_id), MAX_SQL_PARAMETERS):
+            query = select(PostORM.id).where(PostORM.id.in_(chunk))
+            existing_ids.update((await session.scalars(query)).all())
+        updated_ids = [post_id for post_id in posts_by_id if post_id in existing_ids]
+        if not updated_ids:
+            return []
+
+        # A list of parameter sets makes this an ORM bulk UPDATE by primary key.
+        await session.execute(
+            update(PostORM),
+            [
+                {
+                    "id": post_id,
+                    "user_id": posts_by_id[post_id].user_id,
+                    "title": posts_by_id[post_id].title,
+                    "body": posts_by_id[post_id].body,
+                }
+                for post_id in updated_ids
+            ],
+        )
+        return updated_ids
+
+    @staticmethod
+    async def _delete_posts(session: AsyncSession, post_ids: list[int]) -> list[int]:
+        deleted_ids: list[int] = []
+        for chunk in _chunks(post_ids, MAX_SQL_PARAMETERS):
+            statement = delete(PostORM).where(PostORM.id.in_(chunk)).returning(PostORM.id)
+            deleted_ids.extend((await session.scalars(statement)).all())
+        return deleted_ids
@@ -0,0 +1,291 @@
+import sys
+import json
+import time
+import bisect
+import dataclasses
+from types import FrameType
+from typing import Any
+from pathlib import Path
+from collections import Counter
+
+import greenlet
+from loguru import logger
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Upper bounds of the latency histogram buckets in milliseconds.
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, float("inf"))
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+
+@dataclasses.dataclass(slots=True)
+class StatementStats:
+    """
+    Profile of one SQL statement.
+
+    Attributes:
+        statement (str): The SQL text of the statement.
+        calls (int): Number of executions.
+        total (float): Total execution time in seconds.
+        min (float): Fastest execution time in seconds.
+        max (float): Slowest execution time in seconds.
+        rows (int): Rows returned or affected by all executions.
+        slow (int): Executions slower than the profiler threshold.
+        histogram (list[int]): Executions per HISTOGRAM_BOUNDS_MS bucket.
+        call_sites (Counter[str]): Executions per calling function of the application.
+        plan (list[str] | None): EXPLAIN QUERY PLAN of the first slow execution.
+    """
+
+    statement: str
+    calls: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+    rows: int = 0
+    slow: int = 0
+    histogram: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * len(HISTOGRAM_BOUNDS_MS)
+    )
+    call_sites: Counter[str] = dataclasses.field(default_factory=Counter)
+    plan: list[str] | None = None
+
+    @property
+    def mean(self) -> float:
+        """Average execution time in seconds."""
+        return self.total / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the profile to a JSON-serializable dict with times in milliseconds."""
+        return {
+            "statement": self.statement,
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.mean * 1000,
+            "min_ms": self.min * 1000 if self.calls else 0.0,
+            "max_ms": self.max * 1000,
+            "rows": self.rows,
+            "slow": self.slow,
+            "histogram": {
+                f"<={bound}ms": count
+                for bound, count in zip(HISTOGRAM_BOUNDS_MS, self.histogram)
+            },
+            "call_sites": dict(self.call_sites.most_common()),
+            "plan": self.plan,
+        }
+
+
+class QueryProfiler:
+    """
+    Profiler of the SQL statements executed by an engine.
+
+    Every statement is timed through the engine cursor events. Statements slower than
+    slow_threshold are logged together with their EXPLAIN QUERY PLAN, which is captured
+    once per statement. Call sites are the innermost public functions of the application
+    found on the stack, including the coroutines awaiting an async session.
+
+    Args:
+        slow_threshold (float, optional): Seconds after which a statement is slow.
+            Defaults to 0.05.
+
+    Methods:
+        attach(engine: Engine | AsyncEngine) -> None: Start profiling an engine.
+        detach() -> None: Stop profiling.
+        reset() -> None: Forget the collected profiles.
+        statements() -> list[StatementStats]: Get the profiles, slowest in total first.
+        report_text(limit: int = 20) -> str: Format the profiles as a text table.
+        report_json() -> str: Format the profiles as JSON.
+        dump(path: str | Path | None = None) -> None: Log the text report and save the JSON one.
+    """
+
+    def __init__(self, slow_threshold: float = 0.05) -> None:
+        self.slow_threshold = slow_threshold
+        self._stats: dict[str, StatementStats] = {}
+        self._engine: Engine | None = None
+
+    def attach(self, engine: Engine | AsyncEngine) -> None:
+        """
+        Start profiling an engine.
+
+        Args:
+            engine (Engine | AsyncEngine): The engine to profile.
+        """
+        self.detach()
+        if isinstance(engine, AsyncEngine):
+            engine = engine.sync_engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = engine
+
+    def detach(self) -> None:
+        """Stop profiling, keeping the collected profiles."""
+        if self._engine is None:
+            return
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = None
+
+    def reset(self) -> None:
+        """Forget the collected profiles."""
+        self._stats.clear()
+
+    def statements(self) -> list[StatementStats]:
+        """
+        Get the statement profiles.
+
+        Returns:
+            list[StatementStats]: The profiles, the most time consuming first.
+        """
+        return sorted(self._stats.values(), key=lambda stats: stats.total, reverse=True)
+
+    def report_text(self, limit: int = 20) -> str:
+        """
+        Format the statement profiles as a text table.
+
+        Args:
+            limit (int, optional): Maximum number of statements to include. Defaults to 20.
+
+        Returns:
+            str: The report.
+        """
+        lines = [
+            f"{'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9} {'rows':>9} "
+            f"{'slow':>5}  statement"
+        ]
+        for stats in self.statements()[:limit]:
+            statement = " ".join(stats.statement.split())
+            lines.append(
+                f"{stats.calls:>7} {stats.total * 1000:>10.2f} {stats.mean * 1000:>9.3f} "
+                f"{stats.max * 1000:>9.3f} {stats.rows:>9} {stats.slow:>5}  "
+                f"{statement[:120]}"
+            )
+            for call_site, calls in stats.call_sites.most_common(3):
+                lines.append(f"{'':>55}{calls:>7} from {call_site}")
+            for step in stats.plan or ():
+                lines.append(f"{'':>55}  plan: {step}")
+        return "\n".join(lines)
+
+    def report_json(self) -> str:
+        """
+        Format the statement profiles as JSON.
+
+        Returns:
+            str: The report.
+        """
+        return json.dumps(
+            {
+                "slow_threshold_ms": self.slow_threshold * 1000,
+                "statements": [stats.to_dict() for stats in self.statements()],
+            },
+            indent=2,
+        )
+
+    def dump(self, path: str | Path | None = None) -> None:
+        """
+        Log the text report and save the JSON report.
+
+        Args:
+            path (str | Path | None, optional): File to save the JSON report in.
+                Defaults to None (only log the text report).
+        """
+        logger.info("Query profile:\n{report}", report=self.report_text())
+        if path is not None:
+            Path(path).write_text(self.report_json())
+            logger.info("Query profile saved to {path}.", path=path)
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        stats = self._stats.get(statement)
+        if stats is None:
+            stats = self._stats[statement] = StatementStats(statement)
+
+        stats.calls += 1
+        stats.total += elapsed
+        stats.min = min(stats.min, elapsed)
+        stats.max = max(stats.max, elapsed)
+        stats.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, elapsed * 1000)] += 1
+        # SQLite reports no row count for SELECT, but the aiosqlite adapter buffers the
+        # rows of non-streaming cursors before the event fires.
+        rows = cursor.rowcount
+        if rows < 0:
+            rows = len(getattr(cursor, "_rows", None) or ())
+        stats.rows += rows
+        call_site = _call_site()
+        stats.call_sites[call_site] += 1
+
+        if elapsed < self.slow_threshold:
+            return
+        stats.slow += 1
+        if stats.plan is None and statement.lstrip().upper().startswith(_EXPLAINABLE):
+            stats.plan = _explain(conn, statement, parameters, executemany)
+        logger.warning(
+            "Slow query ({elapsed_ms:.1f} ms) from {call_site}: {statement}",
+            elapsed_ms=elapsed * 1000,
+            call_site=call_site,
+            statement=" ".join(statement.split()),
+            plan=stats.plan,
+        )
+
+
+def _call_site() -> str:
+    """
+    Find the innermost public function of the application on the stack.
+
+    Statements of an async engine run in a greenlet, whose stack ends at the session
+    call, so the stack of the suspended parent greenlet running the coroutines is used.
+    Private helpers are skipped in favour of the public method that called them; if
+    there is none, the innermost application frame is used.
+    """
+    frame: FrameType | None = sys._getframe(2)
+    parent = greenlet.getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frame = parent.gr_frame
+
+    fallback = "unknown"
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename.startswith(_PROJECT_ROOT) and code.co_filename != __file__:
+            call_site = (
+                f"{Path(code.co_filename).relative_to(_PROJECT_ROOT)}:"
+                f"{code.co_name}:{frame.f_lineno}"
+            )
+            if not code.co_name.startswith(("_", "<")):
+                return call_site
+            if fallback == "unknown":
+                fallback = call_site
+        frame = frame.f_back
+    return fallback
+
+
+def _explain(conn: Any, statement: str, parameters: Any, executemany: bool) -> list[str]:
+    """Get the EXPLAIN QUERY PLAN of a statement on the connection that executed it."""
+    if executemany:
+        parameters = parameters[0] if parameters else ()
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row[-1] for row in cursor.fetchall()]
+    except Exception as exc:
+        return [f"unavailable: {exc!r}"]
+    finally:
+        cursor.close()
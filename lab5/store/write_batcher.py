@@ -0,0 +1,148 @@
+import asyncio
+import dataclasses
+from typing import Any, TypeVar
+from collections.abc import Callable, Awaitable
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import session_maker
+
+T = TypeVar("T")
+
+Operation = Callable[[AsyncSession], Awaitable[T]]
+
+
+@dataclasses.dataclass(slots=True)
+class WriteBatchStats:
+    """
+    Write batcher counters.
+
+    Attributes:
+        batches (int): Committed batches.
+        operations (int): Operations in committed batches.
+        largest (int): Number of operations in the largest batch.
+        last (int): Number of operations in the last batch.
+        fallbacks (int): Batches that failed and were retried one operation at a time.
+    """
+
+    batches: int = 0
+    operations: int = 0
+    largest: int = 0
+    last: int = 0
+    fallbacks: int = 0
+
+    @property
+    def average(self) -> float:
+        """Average number of operations per batch."""
+        return self.operations / self.batches if self.batches else 0.0
+
+
+class WriteBatcher:
+    """
+    Write-behind batcher that commits concurrent write operations in one transaction.
+
+    Operations submitted within max_delay seconds of each other, up to max_batch_size of
+    them, run in a single session and share one commit. Batches are committed one at a
+    time. If anything in a batch fails, the batch is rolled back and its operations are
+    retried in a transaction each, so every caller gets its own result or error.
+
+    Args:
+        max_batch_size (int, optional): Maximum number of operations in a batch.
+            Defaults to 100.
+        max_delay (float, optional): Seconds to wait for more operations before committing.
+            Defaults to 0.005.
+
+    Methods:
+        submit(operation: Operation[T]) -> asyncio.Future[T]: Schedule a write operation.
+        flush() -> None: Commit all scheduled operations and wait for them.
+    """
+
+    def __init__(self, max_batch_size: int = 100, max_delay: float = 0.005) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.stats = WriteBatchStats()
+        self._pending: list[tuple[Operation[Any], asyncio.Future[Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._lock = asyncio.Lock()
+
+    def submit(self, operation: Operation[T]) -> asyncio.Future[T]:
+        """
+        Schedule a write operation.
+
+        Args:
+            operation (Operation[T]): Coroutine function that writes through the given
+                session without committing it and returns the result for the caller.
+
+        Returns:
+            asyncio.Future[T]: Future resolved with the result of the operation once its
+                batch is committed, or with its error.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        self._pending.append((operation, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._start_batch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._start_batch)
+        return future
+
+    async def flush(self) -> None:
+        """Commit all scheduled operations and wait for them."""
+        self._start_batch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _start_batch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[Operation[Any], asyncio.Future[Any]]]
+    ) -> None:
+        async with self._lock:
+            try:
+                async with session_maker() as session:
+                    results = [await operation(session) for operation, _ in batch]
+                    await session.commit()
+            except Exception as exc:
+                logger.warning(
+                    "Batch of {size} writes failed: {error!r}, retrying one by one.",
+                    size=len(batch),
+                    error=exc,
+                )
+                self.stats.fallbacks += 1
+                for operation, future in batch:
+                    await self._run_one(operation, future)
+                return
+
+        self.stats.batches += 1
+        self.stats.operations += len(batch)
+        self.stats.last = len(batch)
+        self.stats.largest = max(self.stats.largest, len(batch))
+        logger.debug("Committed batch of {size} writes.", size=len(batch))
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run_one(
+        self, operation: Operation[Any], future: asyncio.Future[Any]
+    ) -> None:
+        try:
+            async with session_maker() as session:
+                result = await operation(session)
+                await session.commit()
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+        if not future.done():
+            future.set_result(result)
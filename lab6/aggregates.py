@@ -0,0 +1,122 @@
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+DATE_COLUMN = "Date"
+CATEGORY_COLUMN = "Category"
+VALUE_COLUMNS = ["Value1", "Value2"]
+
+
+class AggregateCache:
+    """
+    Per-date statistics and category counts of the data frame, cached between plots.
+
+    The version is increased whenever the data changes and every aggregate is cached
+    with the version it was computed for. Rows appended since then are aggregated on
+    their own and added to the cached one, so they are never recomputed over the whole
+    frame; after a new data set is loaded the aggregates are computed from scratch.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._cached: dict[str, tuple[int, Any]] = {}
+        # Rows appended at every version since the data set was loaded.
+        self._appended: dict[int, pd.DataFrame] = {}
+
+    def reset(self) -> None:
+        self.version += 1
+        self._appended.clear()
+
+    def append(self, rows: pd.DataFrame) -> None:
+        self.version += 1
+        if self._cached:
+            self._appended[self.version] = rows
+
+    def date_stats(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Count, mean and standard deviation of the values for every date, sorted by date.
+
+        The data frame is only read when the aggregate has to be computed from scratch,
+        so it must contain all rows appended up to now.
+        """
+        sums = self._get("date_sums", data, _date_sums, _add_date_sums)
+        stats = {}
+        for column in VALUE_COLUMNS:
+            count = sums[f"{column}_count"]
+            mean = sums[f"{column}_sum"] / count
+            variance = (sums[f"{column}_squares"] - count * mean**2) / (count - 1)
+            stats[f"{column}_count"] = count
+            stats[f"{column}_mean"] = mean
+            stats[f"{column}_std"] = np.sqrt(variance.clip(lower=0))
+        return pd.DataFrame(stats, index=sums.index)
+
+    def category_counts(self, data: pd.DataFrame) -> pd.Series:
+        """Number of rows of every category, most common first."""
+        return self._get(
+            "category_counts",
+            data,
+            lambda rows: _category_counts(rows[CATEGORY_COLUMN]),
+            _add_category_counts,
+        )
+
+    def _get(
+        self,
+        name: str,
+        data: pd.DataFrame,
+        compute: Callable[[pd.DataFrame], Any],
+        add: Callable[[Any, pd.DataFrame], Any],
+    ) -> Any:
+        cached = self._cached.get(name)
+        if cached is not None and cached[0] != self.version:
+            updates = [
+                self._appended.get(version)
+                for version in range(cached[0] + 1, self.version + 1)
+            ]
+            if any(rows is None for rows in updates):
+                cached = None
+            else:
+                cached = (self.version, add(cached[1], pd.concat(updates)))
+        if cached is None:
+            cached = (self.version, compute(data))
+        self._cached[name] = cached
+
+        # Appended rows already added to every cached aggregate are not needed again.
+        oldest = min(version for version, _ in self._cached.values())
+        for version in [version for version in self._appended if version <= oldest]:
+            del self._appended[version]
+        return cached[1]
+
+
+def _add_date_sums(sums: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    return sums.add(_date_sums(rows), fill_value=0).astype(sums.dtypes).sort_index()
+
+
+def _add_category_counts(counts: pd.Series, rows: pd.DataFrame) -> pd.Series:
+    counts = counts.add(_category_counts(rows[CATEGORY_COLUMN]), fill_value=0)
+    return counts.astype("int64").sort_values(ascending=False, kind="stable")
+
+
+def _category_counts(values: pd.Series) -> pd.Series:
+    # Categorical columns count their unused categories too, and their indexes only
+    # align with indexes of the same categories.
+    counts = values.value_counts()
+    counts = counts[counts > 0]
+    return counts.set_axis(counts.index.astype(object))
+
+
+def _date_sums(data: pd.DataFrame) -> pd.DataFrame:
+    codes, dates = pd.factorize(data[DATE_COLUMN], sort=True)
+    # Missing dates are coded as -1 and left out.
+    valid_dates = codes >= 0
+    codes = codes[valid_dates]
+    sums = {}
+    for column in VALUE_COLUMNS:
+        values = data[column].to_numpy(dtype="float64", na_value=np.nan)[valid_dates]
+        valid = ~np.isnan(values)
+        values = np.where(valid, values, 0.0)
+        sums[f"{column}_count"] = np.bincount(codes, valid, len(dates)).astype("int64")
+        sums[f"{column}_sum"] = np.bincount(codes, values, len(dates))
+        sums[f"{column}_squares"] = np.bincount(codes, values**2, len(dates))
+    return pd.DataFrame(sums, index=dates)
@@ -0,0 +1,58 @@
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+COLUMNS: dict[str, Any] = {
+    "Date": object,
+    "Category": object,
+    "Value1": np.int64,
+    "Value2": np.float64,
+    "BooleanFlag": np.bool_,
+}
+
+
+class AppendBuffer:
+    """
+    Collects appended rows in preallocated column arrays.
+
+    The arrays double in size when full, so an append is O(1) amortized, and the rows
+    are turned into a DataFrame only when they are merged into the main one.
+    """
+
+    def __init__(self, columns: dict[str, Any] = COLUMNS, capacity: int = 1024) -> None:
+        self.columns = columns
+        self._size = 0
+        self._arrays = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in columns.items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: Sequence[Any]) -> None:
+        if self._size == len(next(iter(self._arrays.values()))):
+            self._grow()
+        for array, value in zip(self._arrays.values(), row):
+            array[self._size] = value
+        self._size += 1
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def column(self, name: str) -> np.ndarray:
+        return self._arrays[name][: self._size]
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({name: self.column(name) for name in self.columns})
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def _grow(self) -> None:
+        for name, array in self._arrays.items():
+            grown = np.empty(max(1, len(array) * 2), dtype=array.dtype)
+            grown[: len(array)] = array
+            self._arrays[name] = grown
@@ -0,0 +1,103 @@
+import dataclasses
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+@dataclasses.dataclass(slots=True)
+class ColumnStats:
+    """
+    Running statistics of a numeric column.
+
+    Batches of values are merged with the parallel variance algorithm of Chan et al.,
+    so the statistics never have to be recomputed over the whole column.
+    """
+
+    kind: str = "f"
+    count: int = 0
+    nulls: int = 0
+    minimum: float = np.nan
+    maximum: float = np.nan
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    def update(self, values: Any) -> None:
+        if isinstance(values, pd.Series):
+            array = values.to_numpy(dtype="float64", na_value=np.nan)
+        else:
+            array = np.asarray(values, dtype="float64")
+        valid = array[~np.isnan(array)]
+        self.nulls += len(array) - len(valid)
+        if not len(valid):
+            return
+
+        count = len(valid)
+        mean = valid.mean()
+        m2 = ((valid - mean) ** 2).sum()
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.count = total
+        self.minimum = np.fmin(self.minimum, valid.min())
+        self.maximum = np.fmax(self.maximum, valid.max())
+
+    def format(self, value: float) -> str:
+        if np.isnan(value):
+            return "-"
+        match self.kind:
+            case "b":
+                return str(bool(value))
+            case "i" | "u":
+                return str(int(value))
+            case _:
+                return f"{value:.6g}"
+
+
+class FrameStats:
+    """Line count and running statistics of the numeric columns of a data frame."""
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.columns: list[str] = []
+        self.numeric: dict[str, ColumnStats] = {}
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "FrameStats":
+        stats = cls()
+        stats.update(data)
+        return stats
+
+    def update(self, data: pd.DataFrame) -> None:
+        for column in data.columns:
+            if column not in self.columns:
+                self.columns.append(column)
+                if pd.api.types.is_numeric_dtype(data[column]):
+                    self.numeric[column] = ColumnStats(kind=data[column].dtype.kind)
+        self.update_columns(data, len(data))
+
+    def update_columns(self, columns: Mapping[str, Any], lines: int) -> None:
+        self.lines += lines
+        for column, stats in self.numeric.items():
+            if column in columns:
+                stats.update(columns[column])
+
+    def text(self) -> str:
+        text = (
+            "Statistic:\n"
+            f"Lines number: {self.lines}\n"
+            f"Columns number: {len(self.columns)}"
+        )
+        for column, stats in self.numeric.items():
+            text += (
+                f"\n{column}: Min: {stats.format(stats.minimum)}, "
+                f"Max: {stats.format(stats.maximum)}, Mean: {stats.mean:.6g}, "
+                f"Variance: {stats.variance:.6g}, Nulls: {stats.nulls}"
+            )
+        return text
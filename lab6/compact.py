@@ -0,0 +1,142 @@
+import dataclasses
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+DATE_COLUMNS = ["Date"]
+# Every date is parsed with the same format, so rows parse the same wherever they come from.
+DATE_FORMAT = "ISO8601"
+CATEGORICAL_COLUMNS = ["Category"]
+NULLABLE_INTEGERS = ["Int8", "Int16", "Int32"]
+
+
+@dataclasses.dataclass(slots=True)
+class MemoryReport:
+    """Bytes used by every column before and after the dtypes were compacted."""
+
+    before: dict[str, int] = dataclasses.field(default_factory=dict)
+    after: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    def add_before(self, data: pd.DataFrame) -> None:
+        for column, size in memory_usage(data).items():
+            self.before[column] = self.before.get(column, 0) + size
+
+    def text(self) -> str:
+        text = "Memory:"
+        for column, after in self.after.items():
+            before = self.before.get(column, after)
+            text += f"\n{column}: {_format_bytes(before)} -> {_format_bytes(after)}"
+        text += (
+            f"\nTotal: {_format_bytes(sum(self.before.values()))} -> "
+            f"{_format_bytes(sum(self.after.values()))}"
+        )
+        return text
+
+
+def memory_usage(data: pd.DataFrame) -> dict[str, int]:
+    return {
+        column: int(size)
+        for column, size in data.memory_usage(index=False, deep=True).items()
+    }
+
+
+def compact(data: pd.DataFrame, like: pd.DataFrame | None = None) -> pd.DataFrame:
+    """
+    Convert the columns of a data frame to the smallest dtypes that keep their values.
+
+    Dates are parsed to datetime64 unless some of them are not dates, categories
+    become categorical, integers and floats exact in float32 are downcast and flags
+    without missing values become bool.
+
+    Rows that are going to be added to another data frame are given like, so their
+    dates are parsed only if the dates of that frame are. Then every date has to
+    parse, otherwise ValueError is raised.
+    """
+    return pd.DataFrame(
+        {
+            column: _compact_column(
+                column, values, None if like is None else like.dtypes.get(column)
+            )
+            for column, values in data.items()
+        },
+        index=data.index,
+    )
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """Parse dates in DATE_FORMAT, raising ValueError for the first one that is not."""
+    dates = pd.to_datetime(values, format=DATE_FORMAT, errors="coerce")
+    invalid = dates.isna() & values.notna()
+    if invalid.any():
+        raise ValueError(
+            f"Date should be a valid date, got {values[invalid].iloc[0]!r}"
+        )
+    return dates
+
+
+def concat(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate compacted data frames.
+
+    Categorical columns are recoded to the union of their categories first, since
+    pandas falls back to object for categoricals with different categories.
+    """
+    frames = list(frames)
+    if len(frames) == 1:
+        return frames[0]
+    for column in frames[0].columns:
+        columns = [frame[column] for frame in frames if column in frame]
+        if not all(isinstance(values.dtype, pd.CategoricalDtype) for values in columns):
+            continue
+        categories = columns[0].cat.categories
+        for values in columns[1:]:
+            categories = categories.union(values.cat.categories, sort=False)
+        dtype = pd.CategoricalDtype(categories)
+        for frame in frames:
+            if column in frame and frame[column].dtype != dtype:
+                frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _compact_column(column: str, values: pd.Series, like: object) -> pd.Series:
+    if column in DATE_COLUMNS:
+        if like is None:
+            try:
+                return parse_dates(values)
+            except ValueError:
+                return values
+        if not pd.api.types.is_datetime64_dtype(like):
+            return values
+        return parse_dates(values)
+    if column in CATEGORICAL_COLUMNS:
+        return values.astype("category")
+    if pd.api.types.is_bool_dtype(values):
+        return values if values.hasnans else values.astype(bool)
+    if pd.api.types.is_integer_dtype(values):
+        if not values.hasnans:
+            return pd.to_numeric(values.astype("int64"), downcast="integer")
+        if not len(values.dropna()):
+            return values
+        for dtype in NULLABLE_INTEGERS:
+            info = np.iinfo(dtype.lower())
+            if info.min <= values.min() and values.max() <= info.max:
+                return values.astype(dtype)
+        return values
+    if pd.api.types.is_float_dtype(values):
+        # Only exact float32 values are downcast, pd.to_numeric would round the rest.
+        array = values.to_numpy(dtype="float64")
+        if np.array_equal(array.astype("float32"), array, equal_nan=True):
+            return values.astype("float32")
+        return values
+    return values
+
+
+def _format_bytes(size: float) -> str:
+    if size < 1024:
+        return f"{size:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+    raise AssertionError("unreachable")
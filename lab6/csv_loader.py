@@ -0,0 +1,121 @@
+import os
+from typing import Any
+
+import pandas as pd
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from column_stats import FrameStats
+from compact import MemoryReport, compact, concat, memory_usage
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+CHUNK_ROWS = 100_000
+CHUNK_BYTES = 16 * 1024 * 1024
+
+DTYPES: dict[str, Any] = {
+    "Date": "string",
+    "Category": "string",
+    "Value1": "Int64",
+    "Value2": "float64",
+    "BooleanFlag": "boolean",
+}
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+class CSVLoader(QThread):
+    """
+    Reads a CSV file in chunks and computes its statistics in a worker thread.
+
+    Every chunk is compacted to smaller dtypes as soon as it is read.
+    """
+
+    progress = pyqtSignal(int)
+    loaded = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, path: str, engine: str = "auto") -> None:
+        super().__init__()
+        self.path = path
+        if engine == "auto":
+            engine = "pyarrow" if pa is not None else "c"
+        self.engine = engine
+
+    def run(self) -> None:
+        try:
+            data, stats, memory = self.read()
+        except LoadCancelled:
+            self.cancelled.emit()
+        except Exception as exc:
+            self.failed.emit(f"Failed to load {self.path}: {exc}")
+        else:
+            self.loaded.emit(data, stats, memory)
+
+    def read(self) -> tuple[pd.DataFrame, FrameStats, MemoryReport]:
+        header = pd.read_csv(self.path, nrows=0).columns
+        # Only the columns the visualizer knows are read; other files are read as is.
+        usecols = [column for column in header if column in DTYPES] or None
+        dtypes = {column: DTYPES[column] for column in usecols or ()}
+
+        size = os.path.getsize(self.path) or 1
+        with open(self.path, "rb") as file:
+            if self.engine == "pyarrow":
+                chunks = self._read_pyarrow(file, usecols)
+            else:
+                chunks = pd.read_csv(
+                    file, usecols=usecols, dtype=dtypes, chunksize=CHUNK_ROWS
+                )
+            frames = []
+            stats = FrameStats()
+            memory = MemoryReport()
+            for chunk in chunks:
+                if self.isInterruptionRequested():
+                    raise LoadCancelled
+                if dtypes:
+                    chunk = chunk.astype(dtypes)
+                stats.update(chunk)
+                memory.add_before(chunk)
+                # Later chunks follow the first one, so a date column is either
+                # parsed in all of them or in none, and a later date that does not
+                # parse fails the load instead of becoming NaT.
+                frames.append(compact(chunk, like=frames[0] if frames else None))
+                self.progress.emit(min(99, file.tell() * 100 // size))
+
+        if not frames:
+            data = pd.DataFrame(
+                {column: pd.Series(dtype=dtypes[column]) for column in dtypes}
+            )
+            memory.add_before(data)
+            data = compact(data)
+            memory.after = memory_usage(data)
+            return data, FrameStats.from_frame(data), memory
+        data = concat(frames)
+        memory.after = memory_usage(data)
+        self.progress.emit(100)
+        return data, stats, memory
+
+    def _read_pyarrow(self, file: Any, usecols: list[str] | None) -> Any:
+        reader = pa_csv.open_csv(
+            file,
+            read_options=pa_csv.ReadOptions(block_size=CHUNK_BYTES),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={
+                    "Date": pa.string(),
+                    "Category": pa.string(),
+                    "Value1": pa.int64(),
+                    "Value2": pa.float64(),
+                    "BooleanFlag": pa.bool_(),
+                },
+                include_columns=usecols,
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Pick the points of a line to draw with the largest-triangle-three-buckets algorithm.
+
+    The inner points are split into threshold - 2 buckets and from every bucket the point
+    forming the largest triangle with the previously picked point and the mean of the
+    next bucket is kept, which preserves the visual shape of the line.
+    Returns the sorted indices of the picked points.
+    """
+    size = len(x)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.intp)
+    picked = np.empty(threshold, dtype=np.intp)
+    picked[0] = 0
+    picked[-1] = size - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = size - 1, size
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        picked[bucket + 1] = previous
+    return picked
+
+
+def min_max(y: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Pick the points of a line to draw as a min/max envelope.
+
+    The points are split into buckets of equal size and the minimum and the maximum of
+    every bucket are kept, so spikes are never dropped.
+    Returns the sorted indices of the picked points.
+    """
+    size = len(y)
+    if 2 * buckets >= size or buckets < 1:
+        return np.arange(size)
+
+    y = np.asarray(y, dtype="float64")
+    edges = np.linspace(0, size, buckets + 1).astype(np.intp)[:-1]
+    bucket = np.repeat(np.arange(buckets), np.diff(np.append(edges, size)))
+    # Sorting by bucket and value puts the minimum of every bucket at its start and the
+    # maximum at its end.
+    order = np.lexsort((y, bucket))
+    starts = edges
+    ends = np.append(edges[1:], size) - 1
+    return np.unique(np.concatenate([order[starts], order[ends]]))
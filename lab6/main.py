@@ -1,34 +1,107 @@
+import re
 import sys
+import time
 
+import numpy as np
 import pandas as pd
 import PyQt5.QtWidgets as widgets
+from PyQt5.QtGui import QCloseEvent
 import seaborn as sns
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as Canvas
 from matplotlib.figure import Figure
 
+from aggregates import AggregateCache
+from append_buffer import AppendBuffer
+from column_stats import FrameStats
+from compact import DATE_FORMAT, MemoryReport, compact, concat, memory_usage
+from csv_loader import CSVLoader
+from downsample import lttb, min_max
+
+INPUT_FORMAT_MSG = "Input data in CSV format"
+# Appended rows are merged into the data frame at the latest when there are this many.
+MERGE_THRESHOLD = 10_000
+RENDER_MODES = ["LTTB", "Min/Max", "Full"]
+
+
+def parse_row(
+    line: str, parse_dates: bool = False
+) -> tuple[str, str, int, float, bool]:
+    new_row = line.split(",")
+    if len(new_row) != 5:
+        raise ValueError(INPUT_FORMAT_MSG)
+
+    date = new_row[0].strip()
+    # Dates of a parsed Date column are parsed again when the rows are merged.
+    if parse_dates:
+        try:
+            pd.to_datetime(date, format=DATE_FORMAT)
+        except (ValueError, OverflowError):
+            raise ValueError("Date should be a valid date")
+    category = new_row[1].strip()
+    try:
+        value1 = int(new_row[2])
+    except ValueError:
+        raise ValueError("Value1 should be an integer number")
+    try:
+        value2 = float(new_row[3])
+    except ValueError:
+        raise ValueError("Value2 should be a float number")
+    if new_row[4].strip() not in ("True", "False"):
+        raise ValueError("BooleanFlag should be 'True' or 'False'")
+    bool_flag = new_row[4].strip() == "True"
+    return date, category, value1, value2, bool_flag
+
 
 class MainWindow(widgets.QMainWindow):
     def __init__(self) -> None:
         super().__init__()
 
         self.data: pd.DataFrame | None = None
+        self.loader: CSVLoader | None = None
+        self.appended = AppendBuffer()
+        self.stats: FrameStats | None = None
+        self.memory: MemoryReport | None = None
+        self.aggregates = AggregateCache()
 
         self.setWindowTitle("Visualizer")
         self.setGeometry(100, 100, 800, 600)
 
-        load_button = widgets.QPushButton("Load CSV file", self)
-        load_button.clicked.connect(self.load_csv)
+        self.load_button = widgets.QPushButton("Load CSV file", self)
+        self.load_button.clicked.connect(self.load_csv)
+
+        self.load_progress = widgets.QProgressBar(self)
+        self.load_progress.setRange(0, 100)
+        self.load_progress.hide()
+
+        self.cancel_button = widgets.QPushButton("Cancel", self)
+        self.cancel_button.clicked.connect(self.cancel_load)
+        self.cancel_button.hide()
+
+        load_layout = widgets.QHBoxLayout()
+        load_layout.addWidget(self.load_button)
+        load_layout.addWidget(self.load_progress)
+        load_layout.addWidget(self.cancel_button)
 
         self.status_label = widgets.QLabel("Data is not loaded")
 
         self.plot_type = widgets.QComboBox(self)
         self.plot_type.addItems(["Linear", "Hist", "Pie"])
 
+        # Fast render modes draw a line plot downsampled to the width of the canvas.
+        self.render_mode = widgets.QComboBox(self)
+        self.render_mode.addItems(RENDER_MODES)
+
+        plot_layout = widgets.QHBoxLayout()
+        plot_layout.addWidget(self.plot_type)
+        plot_layout.addWidget(self.render_mode)
+
         draw_button = widgets.QPushButton("Draw plot", self)
         draw_button.clicked.connect(self.draw_plot)
 
         self.new_data_input = widgets.QLineEdit(self)
-        self.new_data_input.setPlaceholderText("Input new values...")
+        self.new_data_input.setPlaceholderText(
+            "Input new values, separate rows with ';'..."
+        )
 
         update_button = widgets.QPushButton("Update data", self)
         update_button.clicked.connect(self.update_data)
@@ -40,9 +113,9 @@ class MainWindow(widgets.QMainWindow):
         self.canvas = Canvas(Figure(figsize=(5, 3)))
 
         layout = widgets.QVBoxLayout()
-        layout.addWidget(load_button)
+        layout.addLayout(load_layout)
         layout.addWidget(self.status_label)
-        layout.addWidget(self.plot_type)
+        layout.addLayout(plot_layout)
         layout.addWidget(draw_button)
         layout.addLayout(data_layout)
         layout.addWidget(self.canvas)
@@ -63,43 +136,109 @@ class MainWindow(widgets.QMainWindow):
             "CSV Files (*.csv);;All Files (*)",
             options=options,
         )
-        if path:
-            self.data = pd.read_csv(path)
-            self.update_statistic()
+        if not path:
+            return
+
+        self.loader = CSVLoader(path)
+        self.loader.progress.connect(self.load_progress.setValue)
+        self.loader.loaded.connect(self.csv_loaded)
+        self.loader.failed.connect(self.status_label.setText)
+        self.loader.cancelled.connect(
+            lambda: self.status_label.setText("Loading cancelled")
+        )
+        self.loader.finished.connect(self.load_finished)
+
+        self.load_button.setEnabled(False)
+        self.load_progress.setValue(0)
+        self.load_progress.show()
+        self.cancel_button.show()
+        self.status_label.setText(f"Loading {path}...")
+        self.loader.start()
+
+    def cancel_load(self) -> None:
+        if self.loader is not None:
+            self.loader.requestInterruption()
+
+    def csv_loaded(
+        self, data: pd.DataFrame, stats: FrameStats, memory: MemoryReport
+    ) -> None:
+        self.data = data
+        self.stats = stats
+        self.memory = memory
+        self.appended.clear()
+        self.aggregates.reset()
+        self.update_statistic()
+
+    def merge_appended(self) -> None:
+        if self.data is None or not len(self.appended):
+            return
+        rows = self.appended.to_frame()
+        self.memory.add_before(rows)
+        self.data = concat([self.data, compact(rows, like=self.data)])
+        self.memory.after = memory_usage(self.data)
+        self.appended.clear()
+
+    def load_finished(self) -> None:
+        self.loader = None
+        self.load_button.setEnabled(True)
+        self.load_progress.hide()
+        self.cancel_button.hide()
 
     def update_statistic(self) -> None:
-        if self.data is None:
+        if self.stats is None:
             return
-        stats = (
-            "Statistic:\n"
-            f"Lines number: {self.data.shape[0]}\n"
-            f"Columns number: {self.data.shape[1]}"
+        self.status_label.setText(f"{self.stats.text()}\n{self.memory.text()}")
+
+    def draw_line(self, y: str) -> None:
+        mode = self.render_mode.currentText()
+        if mode == "Full":
+            sns.lineplot(ax=self.ax, data=self.data, x="Date", y=y)
+            return
+
+        means = self.aggregates.date_stats(self.data)[f"{y}_mean"]
+        dates = pd.to_datetime(means.index, errors="coerce")
+        if dates.isna().any():
+            positions, labels = np.arange(len(means)), means.index
+        else:
+            positions, labels = dates.asi8, dates
+        # One point per pixel is as much as the canvas can show.
+        width = max(int(self.ax.get_window_extent().width), 3)
+        if mode == "LTTB":
+            picked = lttb(positions, means.to_numpy(), width)
+        else:
+            picked = min_max(means.to_numpy(), width // 2)
+        self.ax.plot(labels[picked], means.to_numpy()[picked])
+
+    def draw_bars(self, y: str) -> None:
+        stats = self.aggregates.date_stats(self.data)
+        # Normal approximation of the 95% confidence interval seaborn would bootstrap.
+        errors = 1.96 * stats[f"{y}_std"] / np.sqrt(stats[f"{y}_count"])
+        self.ax.bar(
+            stats.index.astype(str), stats[f"{y}_mean"], yerr=errors, ecolor=".26"
         )
-        for column in self.data.columns:
-            if pd.api.types.is_numeric_dtype(self.data[column]):
-                stats += f"\n{column}: Min: {self.data[column].min()}, Max: {self.data[column].max()}"
-        self.status_label.setText(stats)
 
     def draw_plot(self) -> None:
         if self.data is None:
             return
+        start = time.perf_counter()
+        self.merge_appended()
 
         self.ax.clear()
         match self.plot_type.currentText():
             case "Linear":
-                sns.lineplot(ax=self.ax, data=self.data, x="Date", y="Value1")
+                self.draw_line("Value1")
                 title = "Linear plot: Date[Value1]"
                 x_label = "Date"
                 y_label = "Value1"
                 self.ax.set_aspect("auto")
             case "Hist":
-                sns.barplot(ax=self.ax, data=self.data, x="Date", y="Value2")
+                self.draw_bars("Value2")
                 title = "Hist: Date[Value2]"
                 x_label = "Date"
                 y_label = "Value2"
                 self.ax.set_aspect("auto")
             case "Pie":
-                self.data["Category"].value_counts().plot.pie(
+                self.aggregates.category_counts(self.data).plot.pie(
                     ax=self.ax, autopct="%1.1f%%"
                 )
                 title = "Pie:"
@@ -113,59 +252,58 @@ class MainWindow(widgets.QMainWindow):
         self.ax.set_ylabel(y_label)
         self.canvas.draw()
         self.update_statistic()
+        render_time = (time.perf_counter() - start) * 1000
+        self.status_label.setText(
+            f"{self.status_label.text()}\nRender time: {render_time:.1f} ms"
+        )
 
     def update_data(self) -> None:
         if self.data is None:
             self.status_label.setText("Load CSV data before updating data")
             return
 
-        input_format_msg = "Input data in CSV format"
         new_data = self.new_data_input.text().strip()
         if not new_data:
-            self.status_label.setText(input_format_msg)
+            self.status_label.setText(INPUT_FORMAT_MSG)
             return
 
-        new_row = new_data.split(",")
-        if len(new_row) != 5:
-            self.status_label.setText(input_format_msg)
-            return
+        # Several rows can be added at once, separated by semicolons or new lines.
+        lines = [line for line in re.split(r"[;\n]", new_data) if line.strip()]
+        parse_dates = pd.api.types.is_datetime64_dtype(self.data.dtypes.get("Date"))
+        rows = []
+        for number, line in enumerate(lines, start=1):
+            try:
+                rows.append(parse_row(line, parse_dates))
+            except ValueError as exc:
+                prefix = f"Row {number}: " if len(lines) > 1 else ""
+                self.status_label.setText(f"{prefix}{exc}")
+                return
 
-        date = new_row[0].strip()
-        category = new_row[1].strip()
-        try:
-            value1 = int(new_row[2])
-        except ValueError:
-            self.status_label.setText("Value1 should be an integer number")
-            return
+        columns = dict(zip(self.appended.columns, zip(*rows)))
+        # The rows are compacted before anything is updated, so a failure leaves the
+        # buffer, the statistics and the aggregates as they were.
         try:
-            value2 = float(new_row[3])
-        except ValueError:
-            self.status_label.setText("Value2 should be a float number")
+            compacted = compact(pd.DataFrame(columns), like=self.data)
+        except ValueError as exc:
+            self.status_label.setText(str(exc))
             return
-        if new_row[4].strip() not in ("True", "False"):
-            self.status_label.setText("BooleanFlag should be 'True' or 'False'")
-            return
-        bool_flag = new_row[4].strip() == "True"
-
-        self.data = pd.concat(
-            [
-                self.data,
-                pd.DataFrame(
-                    [
-                        {
-                            "Date": date,
-                            "Category": category,
-                            "Value1": value1,
-                            "Value2": value2,
-                            "BooleanFlag": bool_flag,
-                        }
-                    ]
-                ),
-            ],
-            ignore_index=True,
-        )
+        self.appended.extend(rows)
+        self.stats.update_columns(columns, len(rows))
+        self.aggregates.append(compacted)
+        if len(self.appended) >= MERGE_THRESHOLD:
+            self.merge_appended()
         self.update_statistic()
-        self.status_label.setText("New values added successfully")
+        self.status_label.setText(
+            "New values added successfully"
+            if len(rows) == 1
+            else f"{len(rows)} new rows added successfully"
+        )
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        if self.loader is not None:
+            self.loader.requestInterruption()
+            self.loader.wait()
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":